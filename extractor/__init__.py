@@ -0,0 +1,3 @@
+"""
+Extractor agent that pulls version and change information from pull requests and commits.
+"""
@@ -0,0 +1,89 @@
+# cython: language_level=3
+"""
+Compiled glue for commit-message and pull-request parsing.
+
+Build in place with ``cythonize -i _fastpath.pyx`` (requires Cython and a C
+compiler). extractors.py falls back to its pure-Python parser when this
+module has not been built. The regexes themselves stay in extractors.py and
+are passed in, so both paths always use the same patterns.
+"""
+
+
+cdef object _version_change(str text, object version_matcher, dict version_groups):
+    """Version change of text via the fused matcher, or None."""
+    cdef object match
+    cdef str name
+    cdef tuple groups
+
+    # Every version needs a ".", so dotless text never reaches the regex
+    if "." not in text:
+        return None
+    match = version_matcher.match(text)
+    if match is None:
+        return None
+    for name, groups in version_groups.items():
+        if match.group(name) is not None:
+            if len(groups) == 2:
+                return f"{match.group(groups[0])} -> {match.group(groups[1])}"
+            return match.group(groups[0])
+    return None
+
+
+cdef str _strip_prefix(str text, object leading_version_re):
+    """text without its leading version prefix, if any."""
+    cdef object prefix = leading_version_re.match(text)
+    if prefix is not None:
+        return text[prefix.end():]
+    return text
+
+
+cpdef tuple parse_commit(
+    str message,
+    object version_matcher,
+    dict version_groups,
+    object leading_version_re
+):
+    """
+    Parse a commit message into its (version_change, description).
+
+    Args:
+        message: The commit message text
+        version_matcher: Compiled fused version regex (extractors._VERSION_MATCHER)
+        version_groups: Capture group numbers per branch (extractors._VERSION_GROUPS)
+        leading_version_re: Compiled prefix regex (extractors._LEADING_VERSION_RE)
+
+    Returns:
+        Tuple of (version_change or None, cleaned description)
+    """
+    return (
+        _version_change(message, version_matcher, version_groups),
+        _strip_prefix(message, leading_version_re).strip()
+    )
+
+
+cpdef tuple parse_pr(
+    str title,
+    str body,
+    object version_matcher,
+    dict version_groups,
+    object leading_version_re
+):
+    """
+    Parse a pull request into its (version_change, description).
+
+    Args:
+        title: The PR title
+        body: The PR body
+        version_matcher: As for parse_commit
+        version_groups: As for parse_commit
+        leading_version_re: As for parse_commit
+
+    Returns:
+        Tuple of (version_change or None, cleaned description)
+    """
+    cdef str cleaned_title = _strip_prefix(title, leading_version_re)
+    cdef str description = f"{cleaned_title}\n\n{body}" if body else cleaned_title
+    return (
+        _version_change(f"{title}\n{body}", version_matcher, version_groups),
+        description.strip()
+    )
@@ -1,12 +1,175 @@
 """
 AI Agent for extracting information from pull requests and commits.
 """
-from typing import Optional
+import asyncio
+import json
+import re
+import time
+from functools import cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-from openai import OpenAI
-from config import Config
-from models import ExtractedInfo
-from extractors import CommitExtractor, PullRequestExtractor
+from .config import Config
+from .models import ExtractedInfo
+from .extractors import rule_based_extract_commit, rule_based_extract_pr
+
+
+# Polling of Batch API jobs: start at BATCH_POLL_INITIAL seconds and double
+# up to BATCH_POLL_MAX (batches may take up to their 24h completion window)
+BATCH_POLL_INITIAL = 5.0
+BATCH_POLL_MAX = 300.0
+
+# Default number of AI requests extract_many keeps in flight
+DEFAULT_CONCURRENCY = 8
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert at extracting structured information from software development texts. Always respond with valid JSON."
+}
+
+# User prompt; the text is cut to Config.MAX_PROMPT_CHARS before it is filled in
+_USER_TEMPLATE = """Extract the following information from this {source_type}:
+
+Text to analyze:
+{text}
+
+Please extract:
+1. Repository owner (the GitHub username or organization that owns the repository — look for patterns like "github.com/owner/", "@owner", or explicit mentions of the repo owner in the text)
+2. Version change (if mentioned, format as "X.Y.Z -> A.B.C" for version changes, or just "X.Y.Z" for a single version)
+3. Description of change (a clear, concise description of what changed)
+
+Date: {date}
+
+Respond in JSON format:
+{{
+    "repo_owner": "extracted repository owner username or organization, or null if not found",
+    "version_change": "version change string (e.g., '1.2.3 -> 2.0.0') or null",
+    "description": "description of the change"
+}}
+
+If repo_owner or version_change cannot be determined from the text, use null. Make the description clear and informative."""
+
+# Outermost {...} span of a reply, for models that wrap the JSON in prose or
+# code fences despite response_format=json_object
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+def _safe_json_loads(content: str) -> dict:
+    """
+    Parse the model's JSON reply, tolerating text around the object.
+    
+    Args:
+        content: Message content returned by the model
+        
+    Returns:
+        The decoded JSON object
+        
+    Raises:
+        json.JSONDecodeError: If no JSON object can be recovered
+    """
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        match = _JSON_BLOCK_RE.search(content)
+        if not match:
+            raise
+        return json.loads(match.group(0))
+
+
+# Strings a model sometimes writes instead of a JSON null
+_NULL_STRINGS = frozenset({"null", "none", "n/a"})
+
+
+def _reply_field(result: dict, key: str) -> Optional[str]:
+    """
+    Read one field of the model's reply, treating empty or "null"-like values as missing.
+    
+    Args:
+        result: Decoded JSON reply
+        key: Field name
+        
+    Returns:
+        The field value, or None if it is absent, empty or a null placeholder
+    """
+    value = result.get(key)
+    if not value or (isinstance(value, str) and value.strip().lower() in _NULL_STRINGS):
+        return None
+    return value
+
+
+@cache
+def _get_openai_client(api_key: str, max_retries: int):
+    """
+    Return an OpenAI client shared by all agents with the same settings.
+    
+    Agents are often created per call; sharing the client keeps its
+    connection pool, so only the first request pays the TLS handshake.
+    """
+    # Imported here so importing this module does not load the SDK
+    from openai import OpenAI
+    return OpenAI(api_key=api_key, max_retries=max_retries)
+
+
+def _is_complete_json(content: str) -> bool:
+    """Return True if content already holds the whole JSON reply."""
+    # Only try to parse once the text could end an object
+    if not content.rstrip().endswith("}"):
+        return False
+    try:
+        json.loads(content)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
+def _collect_streamed_json(stream) -> str:
+    """
+    Join a streamed reply, stopping as soon as it forms a complete JSON object.
+    
+    In JSON mode a model can keep emitting whitespace after the object until
+    max_tokens is reached; stopping at the closing brace avoids waiting for it.
+    
+    Args:
+        stream: Chat completion stream (stream=True)
+        
+    Returns:
+        The reply text received so far
+    """
+    content = ""
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            content += chunk.choices[0].delta.content
+            if _is_complete_json(content):
+                break
+    return content
+
+
+async def _acollect_streamed_json(stream) -> str:
+    """Async version of _collect_streamed_json."""
+    content = ""
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            content += chunk.choices[0].delta.content
+            if _is_complete_json(content):
+                break
+    return content
+
+
+# A description starting with one of these is the rest of a version change
+# the rule-based parser only half understood (e.g. "v2.0.0 -> v2.0.1: ...")
+_LEFTOVER_SEPARATORS = ("->", ">", "→", "-", ":")
+
+
+def _rule_based_confidence(info: ExtractedInfo) -> float:
+    """Confidence in a rule-based result: 1.0 if it found a version and kept a clean, real description."""
+    description = info.description
+    if info.version_change is None or len(description) <= 10 or description.startswith(_LEFTOVER_SEPARATORS):
+        return 0.0
+    return 1.0
+
+
+def pr_text(title: str, body: str) -> str:
+    """Text of a pull request as sent to the model (split back up by the rule-based fallback)."""
+    return f"Title: {title}\n\nDescription: {body}"
 
 
 class AIAgent:
@@ -15,10 +178,32 @@ class AIAgent:
     def __init__(self):
         """Initialize the AI agent with OpenAI client."""
         Config.validate()
-        self.client = OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = _get_openai_client(Config.OPENAI_API_KEY, Config.OPENAI_MAX_RETRIES)
+        # Created on first concurrent extraction; its connection pool belongs
+        # to the event loop it was created in
+        self._aclient = None
+        self._aclient_loop = None
+        # extract_many calls in progress; the last one to finish closes _aclient
+        self._extract_many_running = 0
         self.model = Config.OPENAI_MODEL
         self.temperature = Config.OPENAI_TEMPERATURE
     
+    @property
+    def aclient(self):
+        """Async OpenAI client for the running event loop, created on first use in it."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            from openai import AsyncOpenAI
+            self._aclient = AsyncOpenAI(api_key=Config.OPENAI_API_KEY, max_retries=Config.OPENAI_MAX_RETRIES)
+            self._aclient_loop = loop
+        return self._aclient
+    
+    async def _close_aclient(self):
+        """Close the async client (and its connections) before its event loop ends."""
+        if self._aclient is not None:
+            client, self._aclient, self._aclient_loop = self._aclient, None, None
+            await client.close()
+    
     def extract_from_commit(
         self,
         commit_message: str,
@@ -46,11 +231,7 @@ class AIAgent:
                 source_type="commit"
             )
         else:
-            return CommitExtractor.extract_from_commit_message(
-                commit_message=commit_message,
-                repo_owner=repo_owner,
-                date=date
-            )
+            return rule_based_extract_commit(commit_message, repo_owner, date)
     
     def extract_from_pr(
         self,
@@ -74,20 +255,83 @@ class AIAgent:
             ExtractedInfo object with extracted data
         """
         if use_ai:
-            full_text = f"Title: {title}\n\nDescription: {body}"
             return self._extract_with_ai(
-                text=full_text,
+                text=pr_text(title, body),
                 repo_owner_hint=repo_owner,
                 date=date,
                 source_type="pull request"
             )
         else:
-            return PullRequestExtractor.extract_from_pr(
-                title=title,
-                body=body,
-                repo_owner=repo_owner,
-                date=date
-            )
+            return rule_based_extract_pr(title, body, repo_owner, date)
+    
+    def _build_messages(self, text: str, date: datetime, source_type: str) -> List[Dict[str, str]]:
+        """Build the chat messages asking the model to extract information from text."""
+        prompt = _USER_TEMPLATE.format(
+            source_type=source_type,
+            text=text[:Config.MAX_PROMPT_CHARS],
+            date=date.isoformat()
+        )
+        return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+    
+    def _request_body(self, text: str, date: datetime, source_type: str) -> dict:
+        """Chat completion parameters for one extraction (shared by single and batch calls)."""
+        return {
+            "model": self.model,
+            "messages": self._build_messages(text, date, source_type),
+            "temperature": self.temperature,
+            "max_tokens": Config.OPENAI_MAX_TOKENS,
+            "response_format": {"type": "json_object"}
+        }
+    
+    @staticmethod
+    def _to_extracted_info(content: str, text: str, repo_owner_hint: str, date: datetime) -> ExtractedInfo:
+        """Turn the model's JSON reply into an ExtractedInfo."""
+        result = _safe_json_loads(content)
+        
+        # Use AI-extracted repo_owner, fall back to hint if AI returns null
+        extracted_repo_owner = _reply_field(result, "repo_owner") or repo_owner_hint
+        
+        return ExtractedInfo(
+            repo_owner=extracted_repo_owner,
+            date=date,
+            version_change=_reply_field(result, "version_change"),
+            description=_reply_field(result, "description") or text
+        )
+    
+    @staticmethod
+    def _rule_based_fallback(text: str, repo_owner_hint: str, date: datetime, source_type: str) -> ExtractedInfo:
+        """Rule-based extraction of text built for the AI prompt."""
+        if source_type == "commit":
+            return rule_based_extract_commit(text, repo_owner_hint, date)
+        else:
+            # Split title and body for PR
+            lines = text.split("\n", 1)
+            title = lines[0].replace("Title: ", "")
+            body = lines[1].replace("Description: ", "") if len(lines) > 1 else ""
+            return rule_based_extract_pr(title, body, repo_owner_hint, date)
+    
+    @classmethod
+    def _confident_rule_based(
+        cls,
+        text: str,
+        repo_owner_hint: str,
+        date: datetime,
+        source_type: str
+    ) -> Optional[ExtractedInfo]:
+        """
+        Rule-based result, if it is confident enough to skip the AI request.
+        
+        Returns:
+            The rule-based ExtractedInfo, or None if the AI should be asked
+        """
+        try:
+            info = cls._rule_based_fallback(text, repo_owner_hint, date, source_type)
+        except ValueError:
+            # E.g. no repo owner hint; the AI may still find one in the text
+            return None
+        if _rule_based_confidence(info) >= Config.RULE_CONFIDENCE_THRESHOLD:
+            return info
+        return None
     
     def _extract_with_ai(
         self,
@@ -108,58 +352,155 @@ class AIAgent:
         Returns:
             ExtractedInfo object with extracted data
         """
-        prompt = f"""Extract the following information from this {source_type}:
-
-Text to analyze:
-{text}
-
-Please extract:
-1. Repository owner (the GitHub username or organization that owns the repository — look for patterns like "github.com/owner/", "@owner", or explicit mentions of the repo owner in the text)
-2. Version change (if mentioned, format as "X.Y.Z -> A.B.C" for version changes, or just "X.Y.Z" for a single version)
-3. Description of change (a clear, concise description of what changed)
-
-Date: {date.isoformat()}
-
-Respond in JSON format:
-{{
-    "repo_owner": "extracted repository owner username or organization, or null if not found",
-    "version_change": "version change string (e.g., '1.2.3 -> 2.0.0') or null",
-    "description": "description of the change"
-}}
-
-If repo_owner or version_change cannot be determined from the text, use null. Make the description clear and informative."""
-
+        confident = self._confident_rule_based(text, repo_owner_hint, date, source_type)
+        if confident is not None:
+            return confident
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert at extracting structured information from software development texts. Always respond with valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"}
-            )
-            
-            import json
-            result = json.loads(response.choices[0].message.content)
-
-            # Use AI-extracted repo_owner, fall back to hint if AI returns null
-            extracted_repo_owner = result.get("repo_owner") or repo_owner_hint
-
-            return ExtractedInfo(
-                repo_owner=extracted_repo_owner,
-                date=date,
-                version_change=result.get("version_change") or None,
-                description=result.get("description") or text
-            )
+            with self.client.chat.completions.create(
+                **self._request_body(text, date, source_type), stream=True
+            ) as stream:
+                content = _collect_streamed_json(stream)
+            return self._to_extracted_info(content, text, repo_owner_hint, date)
         except Exception as e:
             # Fallback to rule-based extraction if AI fails
             print(f"AI extraction failed: {e}. Falling back to rule-based extraction.")
-            if source_type == "commit":
-                return CommitExtractor.extract_from_commit_message(text, repo_owner_hint, date)
-            else:
-                # Split title and body for PR
-                lines = text.split("\n", 1)
-                title = lines[0].replace("Title: ", "")
-                body = lines[1].replace("Description: ", "") if len(lines) > 1 else ""
-                return PullRequestExtractor.extract_from_pr(title, body, repo_owner_hint, date)
+            return self._rule_based_fallback(text, repo_owner_hint, date, source_type)
+    
+    async def _aextract_with_ai(
+        self,
+        text: str,
+        repo_owner_hint: str,
+        date: datetime,
+        source_type: str
+    ) -> ExtractedInfo:
+        """Async version of _extract_with_ai, using the async client."""
+        confident = self._confident_rule_based(text, repo_owner_hint, date, source_type)
+        if confident is not None:
+            return confident
+        
+        try:
+            async with await self.aclient.chat.completions.create(
+                **self._request_body(text, date, source_type), stream=True
+            ) as stream:
+                content = await _acollect_streamed_json(stream)
+            return self._to_extracted_info(content, text, repo_owner_hint, date)
+        except Exception as e:
+            # Fallback to rule-based extraction if AI fails
+            print(f"AI extraction failed: {e}. Falling back to rule-based extraction.")
+            return self._rule_based_fallback(text, repo_owner_hint, date, source_type)
+    
+    async def extract_many(
+        self,
+        jobs: List[Tuple[str, str, datetime, str]],
+        concurrency: int = DEFAULT_CONCURRENCY
+    ) -> List[ExtractedInfo]:
+        """
+        Extract many items with up to ``concurrency`` AI requests in flight.
+        
+        The async client is closed when the call finishes, so each asyncio.run
+        (a new event loop) starts with a client of its own.
+        
+        Args:
+            jobs: (text, repo_owner_hint, date, source_type) tuples, as for extract_batch
+            concurrency: Maximum number of simultaneous requests
+            
+        Returns:
+            ExtractedInfo objects, in the order of jobs
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def extract_one(job):
+            async with semaphore:
+                return await self._aextract_with_ai(*job)
+        
+        self._extract_many_running += 1
+        try:
+            return await asyncio.gather(*(extract_one(job) for job in jobs))
+        finally:
+            self._extract_many_running -= 1
+            if not self._extract_many_running:
+                await self._close_aclient()
+    
+    def extract_batch(self, items: List[Tuple[str, str, datetime, str]]) -> List[ExtractedInfo]:
+        """
+        Extract many items in one OpenAI Batch API job.
+        
+        Batch jobs are billed at a discount and have no per-call latency, but
+        can take up to 24 hours; use this for bulk runs, not interactive ones.
+        Items the batch could not answer fall back to rule-based extraction.
+        
+        Args:
+            items: (text, repo_owner_hint, date, source_type) tuples, with text
+                   and source_type as passed to _extract_with_ai
+            
+        Returns:
+            ExtractedInfo objects, in the order of items
+        """
+        if len(items) <= 1:
+            # Not worth a batch job
+            return [self._extract_with_ai(*item) for item in items]
+        
+        lines = [
+            json.dumps({
+                "custom_id": f"item-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_body(text, date, source_type)
+            })
+            for i, (text, _, date, source_type) in enumerate(items)
+        ]
+        
+        try:
+            batch_file = self.client.files.create(
+                file=("extraction_batch.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            contents = self._read_batch_output(self._wait_for_batch(batch.id))
+        except Exception as e:
+            print(f"AI batch extraction failed: {e}. Falling back to rule-based extraction.")
+            contents = {}
+        
+        results = []
+        for i, (text, repo_owner_hint, date, source_type) in enumerate(items):
+            content = contents.get(f"item-{i}")
+            try:
+                if content is None:
+                    raise ValueError("no response in batch output")
+                results.append(self._to_extracted_info(content, text, repo_owner_hint, date))
+            except Exception as e:
+                print(f"AI extraction failed for item {i}: {e}. Falling back to rule-based extraction.")
+                results.append(self._rule_based_fallback(text, repo_owner_hint, date, source_type))
+        return results
+    
+    def _wait_for_batch(self, batch_id: str):
+        """Poll a batch with exponential backoff until it completes."""
+        delay = BATCH_POLL_INITIAL
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                return batch
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"batch {batch_id} ended with status '{batch.status}'")
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX)
+    
+    def _read_batch_output(self, batch) -> Dict[str, str]:
+        """Map custom_id to message content for every successful request in a batch."""
+        if not batch.output_file_id:
+            return {}
+        
+        contents = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                contents[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return contents
@@ -13,6 +13,16 @@ class Config:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4")
     OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
+    # Retries of rate-limited (429), 5xx and connection failures before the
+    # rule-based fallback; the SDK backs off exponentially and honors Retry-After
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+    # Cap on reply length; the JSON answer is short
+    OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", "256"))
+    # Rule-based results at least this confident skip the AI request
+    # (scores are 0.0 or 1.0; set above 1 to always ask the AI)
+    RULE_CONFIDENCE_THRESHOLD = float(os.getenv("RULE_CONFIDENCE_THRESHOLD", "0.9"))
+    # Commit/PR text beyond this many characters is left out of the prompt
+    MAX_PROMPT_CHARS = int(os.getenv("MAX_PROMPT_CHARS", "4000"))
     
     # GitHub Configuration
     GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
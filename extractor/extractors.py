@@ -1,10 +1,136 @@
 """
 Extractors for pull requests and commits.
 """
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from datetime import datetime
 import re
-from models import ExtractedInfo
+from .models import ExtractedInfo
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; Python's re is used instead
+    re2 = None
+
+try:
+    from ._fastpath import parse_commit as _compiled_parse_commit, parse_pr as _compiled_parse_pr
+except ImportError:  # Cython extension not built; commits and PRs are parsed in Python
+    _compiled_parse_commit = _compiled_parse_pr = None
+
+
+# Patterns for version changes: v1.2.3 -> v2.0.0, 1.2.3 -> 2.0.0, etc.
+# Listed in priority order: a later pattern is only used if no earlier one
+# matches anywhere in the text.
+_VERSION_BRANCHES = (
+    ("pair3", r'v?(\d+\.\d+\.\d+)\s*[-→>]\s*v?(\d+\.\d+\.\d+)'),  # 1.2.3 -> 2.0.0
+    ("pair2", r'v?(\d+\.\d+)\s*[-→>]\s*v?(\d+\.\d+)'),  # 1.2 -> 2.0
+    ("verto", r'version\s+(\d+\.\d+\.\d+)\s*to\s*(\d+\.\d+\.\d+)'),  # version 1.2.3 to 2.0.0
+    ("upgrade", r'upgrade.*?v?(\d+\.\d+\.\d+).*?v?(\d+\.\d+\.\d+)'),  # upgrade from 1.2.3 to 2.0.0
+    ("bump", r'bump.*?v?(\d+\.\d+\.\d+).*?v?(\d+\.\d+\.\d+)'),  # bump version 1.2.3 to 2.0.0
+    ("single", r'v?(\d+\.\d+\.\d+)'),  # Single version (assume it's the new version)
+)
+
+# All patterns fused into one anchored alternation. Each branch lazily skips
+# ahead to its own leftmost match, and branches are tried in order, so a single
+# match() call gives the same result as searching for each pattern in turn.
+_VERSION_PATTERN = "(?:" + "|".join(
+    rf"[\s\S]*?(?P<{name}>{pattern})" for name, pattern in _VERSION_BRANCHES
+) + ")"
+_VERSION_RE = re.compile(_VERSION_PATTERN, re.IGNORECASE)
+
+# With google-re2 installed the same pattern runs on a linear-time automaton,
+# so the lazy skips cannot backtrack on long release-note messages.
+# Group numbering is identical, so _VERSION_GROUPS applies to either engine.
+_VERSION_MATCHER = _VERSION_RE
+if re2 is not None:
+    try:
+        _VERSION_MATCHER = re2.compile("(?i)" + _VERSION_PATTERN)
+    except Exception:  # pattern rejected by re2; keep the backtracking engine
+        pass
+
+# Every branch needs a "digit.digit" somewhere; one cheap scan for it rules
+# out the many messages that mention no version before the fused match runs
+_VERSION_HINT_RE = re.compile(r'\d\.\d')
+
+# Group numbers of the captured version(s) for each branch
+# (the numbered groups directly after the branch's named group)
+_VERSION_GROUPS = {}
+for _name, _pattern in _VERSION_BRANCHES:
+    _first = _VERSION_RE.groupindex[_name] + 1
+    _VERSION_GROUPS[_name] = tuple(range(_first, _first + re.compile(_pattern).groups))
+del _name, _pattern, _first
+
+# Leading version prefix removed from descriptions: a version change, a single
+# version, or "version X.Y.Z", plus any trailing separator. The change's second
+# version is an optional tail on the first, so the first is scanned only once.
+_LEADING_VERSION_RE = re.compile(
+    r'^(?:v?\d+\.\d+\.\d+(?:\s*[-→>]\s*v?\d+\.\d+\.\d+)?|version\s+\d+\.\d+\.\d+)\s*[-:]?\s*',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
+def _extract_version_change(text: str) -> Optional[str]:
+    """Extract version change information from text (cached; release notes repeat)."""
+    # A literal "." test (a memchr scan) rules out dotless messages even
+    # before the hint regex
+    if "." not in text or not _VERSION_HINT_RE.search(text):
+        return None
+    
+    match = _VERSION_MATCHER.match(text)
+    if not match:
+        return None
+    
+    # Find the branch that matched by its named group rather than lastgroup,
+    # which re2's match objects do not compute the same way
+    groups = next(
+        groups for name, groups in _VERSION_GROUPS.items() if match.group(name) is not None
+    )
+    if len(groups) == 2:
+        # Version change from X to Y
+        return f"{match.group(groups[0])} -> {match.group(groups[1])}"
+    # Single version found
+    return match.group(groups[0])
+
+
+def _strip_version_prefix(text: str) -> str:
+    """Remove a version pattern if it's at the start of the text."""
+    # Every prefix starts with "v" or a digit; most messages are settled by
+    # their first character without calling into the regex engine
+    first = text[:1]
+    if not (first.isdigit() or first in "vV"):
+        return text
+    
+    # Anchored match + slice: no substitution pass or string rebuild
+    match = _LEADING_VERSION_RE.match(text)
+    return text[match.end():] if match else text
+
+
+@lru_cache(maxsize=4096)
+def _parse_commit(message: str) -> Tuple[Optional[str], str]:
+    """
+    Parse a commit message into its (version_change, description).
+    
+    Cached because merge commits and templated release notes repeat
+    the same message many times across a repository's history.
+    """
+    if _compiled_parse_commit is not None:
+        return _compiled_parse_commit(message, _VERSION_MATCHER, _VERSION_GROUPS, _LEADING_VERSION_RE)
+    return (
+        CommitExtractor._extract_version_change(message),
+        CommitExtractor._clean_description(message)
+    )
+
+
+def _parse_pr(title: str, body: str) -> Tuple[Optional[str], str]:
+    """Parse a pull request into its (version_change, description)."""
+    if _compiled_parse_pr is not None:
+        return _compiled_parse_pr(title, body, _VERSION_MATCHER, _VERSION_GROUPS, _LEADING_VERSION_RE)
+    return (
+        # Combine title and body for analysis
+        PullRequestExtractor._extract_version_change(f"{title}\n{body}"),
+        PullRequestExtractor._clean_description(title, body)
+    )
 
 
 class CommitExtractor:
@@ -27,11 +153,8 @@ class CommitExtractor:
         Returns:
             ExtractedInfo object with extracted data
         """
-        # Try to extract version change from commit message
-        version_change = CommitExtractor._extract_version_change(commit_message)
-        
-        # Clean up the description
-        description = CommitExtractor._clean_description(commit_message)
+        # Version change and cleaned description depend only on the message
+        version_change, description = _parse_commit(commit_message)
         
         return ExtractedInfo(
             repo_owner=repo_owner,
@@ -40,38 +163,14 @@ class CommitExtractor:
             description=description
         )
     
-    @staticmethod
-    def _extract_version_change(text: str) -> Optional[str]:
-        """Extract version change information from text."""
-        # Patterns for version changes: v1.2.3 -> v2.0.0, 1.2.3 -> 2.0.0, etc.
-        patterns = [
-            r'v?(\d+\.\d+\.\d+)\s*[-→>]\s*v?(\d+\.\d+\.\d+)',  # 1.2.3 -> 2.0.0
-            r'v?(\d+\.\d+)\s*[-→>]\s*v?(\d+\.\d+)',  # 1.2 -> 2.0
-            r'version\s+(\d+\.\d+\.\d+)\s*to\s*(\d+\.\d+\.\d+)',  # version 1.2.3 to 2.0.0
-            r'upgrade.*?v?(\d+\.\d+\.\d+).*?v?(\d+\.\d+\.\d+)',  # upgrade from 1.2.3 to 2.0.0
-            r'bump.*?v?(\d+\.\d+\.\d+).*?v?(\d+\.\d+\.\d+)',  # bump version 1.2.3 to 2.0.0
-            r'v?(\d+\.\d+\.\d+)',  # Single version (assume it's the new version)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 2:
-                    # Version change from X to Y
-                    return f"{match.group(1)} -> {match.group(2)}"
-                else:
-                    # Single version found
-                    return match.group(1)
-        
-        return None
+    # Shared compiled-regex implementation, bound directly rather than wrapped
+    _extract_version_change = staticmethod(_extract_version_change)
     
     @staticmethod
     def _clean_description(text: str) -> str:
         """Clean and format the description."""
-        # Remove version patterns if they're at the start
-        text = re.sub(r'^v?\d+\.\d+\.\d+\s*[-→>]\s*v?\d+\.\d+\.\d+\s*[-:]?\s*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'^v?\d+\.\d+\.\d+\s*[-:]?\s*', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'^version\s+\d+\.\d+\.\d+\s*[-:]?\s*', '', text, flags=re.IGNORECASE)
+        # Remove a version pattern if it's at the start
+        text = _strip_version_prefix(text)
         
         # Strip whitespace
         text = text.strip()
@@ -101,14 +200,7 @@ class PullRequestExtractor:
         Returns:
             ExtractedInfo object with extracted data
         """
-        # Combine title and body for analysis
-        full_text = f"{title}\n{body}"
-        
-        # Try to extract version change
-        version_change = PullRequestExtractor._extract_version_change(full_text)
-        
-        # Clean up the description
-        description = PullRequestExtractor._clean_description(title, body)
+        version_change, description = _parse_pr(title, body)
         
         return ExtractedInfo(
             repo_owner=repo_owner,
@@ -117,45 +209,58 @@ class PullRequestExtractor:
             description=description
         )
     
-    @staticmethod
-    def _extract_version_change(text: str) -> Optional[str]:
-        """Extract version change information from text."""
-        # Patterns for version changes: v1.2.3 -> v2.0.0, 1.2.3 -> 2.0.0, etc.
-        patterns = [
-            r'v?(\d+\.\d+\.\d+)\s*[-→>]\s*v?(\d+\.\d+\.\d+)',  # 1.2.3 -> 2.0.0
-            r'v?(\d+\.\d+)\s*[-→>]\s*v?(\d+\.\d+)',  # 1.2 -> 2.0
-            r'version\s+(\d+\.\d+\.\d+)\s*to\s*(\d+\.\d+\.\d+)',  # version 1.2.3 to 2.0.0
-            r'upgrade.*?v?(\d+\.\d+\.\d+).*?v?(\d+\.\d+\.\d+)',  # upgrade from 1.2.3 to 2.0.0
-            r'bump.*?v?(\d+\.\d+\.\d+).*?v?(\d+\.\d+\.\d+)',  # bump version 1.2.3 to 2.0.0
-            r'v?(\d+\.\d+\.\d+)',  # Single version (assume it's the new version)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 2:
-                    # Version change from X to Y
-                    return f"{match.group(1)} -> {match.group(2)}"
-                else:
-                    # Single version found
-                    return match.group(1)
-        
-        return None
+    # Shared compiled-regex implementation, bound directly rather than wrapped
+    _extract_version_change = staticmethod(_extract_version_change)
     
     @staticmethod
     def _clean_description(title: str, body: str) -> str:
         """Clean and format the description."""
-        # Combine title and body
-        description = f"{title}"
-        if body:
-            description += f"\n\n{body}"
+        # Only the title can start with a version prefix, so clean it alone
+        # rather than running the regex over the combined text
+        title = _strip_version_prefix(title)
         
-        # Remove version patterns if they're at the start
-        description = re.sub(r'^v?\d+\.\d+\.\d+\s*[-→>]\s*v?\d+\.\d+\.\d+\s*[-:]?\s*', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'^v?\d+\.\d+\.\d+\s*[-:]?\s*', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'^version\s+\d+\.\d+\.\d+\s*[-:]?\s*', '', description, flags=re.IGNORECASE)
+        # Combine title and body, then strip whitespace
+        description = f"{title}\n\n{body}" if body else title
+        return description.strip()
+
+
+def rule_based_extract_commit(commit_message: str, repo_owner: str, date: datetime) -> ExtractedInfo:
+    """
+    Extract information from a commit with the rule-based extractor only.
+    
+    Needs no API key and never loads the OpenAI client.
+    
+    Args:
+        commit_message: The commit message
+        repo_owner: The repository owner name
+        date: The commit date
         
-        # Strip whitespace
-        description = description.strip()
+    Returns:
+        ExtractedInfo object with extracted data
+    """
+    return CommitExtractor.extract_from_commit_message(
+        commit_message=commit_message,
+        repo_owner=repo_owner,
+        date=date
+    )
+
+
+def rule_based_extract_pr(title: str, body: str, repo_owner: str, date: datetime) -> ExtractedInfo:
+    """
+    Extract information from a pull request with the rule-based extractor only.
+    
+    Args:
+        title: The PR title
+        body: The PR body/description
+        repo_owner: The repository owner name
+        date: The PR creation date
         
-        return description
+    Returns:
+        ExtractedInfo object with extracted data
+    """
+    return PullRequestExtractor.extract_from_pr(
+        title=title,
+        body=body,
+        repo_owner=repo_owner,
+        date=date
+    )
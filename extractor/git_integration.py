@@ -1,10 +1,108 @@
 """
 Local Git integration for extracting information from commits.
 """
-from typing import Optional
+import configparser
+import os
+import re
+from functools import cached_property, lru_cache
+from typing import List, Optional, Tuple
 from datetime import datetime
-from git import Repo
-from ai_agent import AIAgent
+from .ai_agent import DEFAULT_CONCURRENCY, AIAgent
+from .extractors import rule_based_extract_commit
+
+try:
+    import pygit2
+except ImportError:  # pygit2 is optional; fall back to GitPython
+    pygit2 = None
+    from git import Repo
+
+# Remote URL forms: scheme://[user@]host/owner/repo(.git) (https, ssh, git)
+# and the scp-like git@host:owner/repo(.git)
+_URL_REMOTE_RE = re.compile(r'^(?:https?|ssh|git)://(?:[^@/]+@)?[^/]+/([^/]+)/([^/]+?)(?:\.git)?/?$')
+_SSH_REMOTE_RE = re.compile(r'^git@[^:]+:([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+# The url of the [remote "origin"] section in a git config file
+_ORIGIN_URL_RE = re.compile(rb'^\[remote "origin"\][^\[]*?^\s*url\s*=\s*(\S+)', re.MULTILINE | re.DOTALL)
+
+# A full 40-character commit SHA, which can be matched against hexsha directly
+_FULL_SHA_RE = re.compile(r'^[0-9a-f]{40}$')
+
+
+@lru_cache(maxsize=8)
+def _open_repo(real_path: str):
+    """Open a repository once per resolved path and reuse the handle."""
+    if pygit2 is not None:
+        return pygit2.Repository(real_path)
+    return Repo(real_path)
+
+
+def _read_origin_url(git_dir: str) -> Optional[str]:
+    """Scan the repository's config file for the origin URL, without a config parser."""
+    try:
+        with open(os.path.join(git_dir, "config"), "rb") as f:
+            match = _ORIGIN_URL_RE.search(f.read())
+    except OSError:
+        return None
+    return match.group(1).decode() if match else None
+
+
+def _remote_url(repo) -> Optional[str]:
+    """Return the URL of the "origin" remote, or None if there is none."""
+    # Reading the one line needed is cheaper than loading the whole config;
+    # the library is only asked when that fails (e.g. includes, worktrees)
+    url = _read_origin_url(repo.path if pygit2 is not None else repo.common_dir)
+    if url:
+        return url
+    
+    if pygit2 is not None:
+        try:
+            return repo.remotes["origin"].url
+        except KeyError:
+            return None
+    try:
+        return repo.remote().url
+    except (ValueError, configparser.Error):
+        # No "origin" remote, or it has no URL configured
+        return None
+
+
+def _resolve_commit(repo, rev: str):
+    """Look up a commit by SHA (full or short) or other revision."""
+    if pygit2 is not None:
+        return repo.revparse_single(rev).peel(pygit2.Commit)
+    return repo.commit(rev)
+
+
+def _commit_timestamp(commit) -> int:
+    """Return a commit's committer timestamp (pygit2 and GitPython name it differently)."""
+    if pygit2 is not None:
+        return commit.commit_time
+    return commit.committed_date
+
+
+def _iter_head_commits(repo):
+    """Yield (hexsha, commit) for the history reachable from HEAD."""
+    if pygit2 is not None:
+        for commit in repo.walk(repo.head.target):
+            yield str(commit.id), commit
+    else:
+        for commit in repo.iter_commits("HEAD"):
+            yield commit.hexsha, commit
+
+
+def _iter_range_commits(repo, rev_range: str):
+    """Yield the commits of a revision range ("A..B", or a single revision for its history), newest first."""
+    if pygit2 is None:
+        yield from repo.iter_commits(rev_range)
+        return
+    
+    exclude, sep, include = rev_range.partition("..")
+    if not sep:
+        exclude, include = "", rev_range
+    walker = repo.walk(_resolve_commit(repo, include or "HEAD").id)
+    if exclude:
+        walker.hide(_resolve_commit(repo, exclude).id)
+    yield from walker
 
 
 class GitIntegration:
@@ -18,30 +116,50 @@ class GitIntegration:
             repo_path: Path to the git repository
             repo_owner: Repository owner name (if not provided, will try to extract from remote)
         """
-        self.repo = Repo(repo_path)
-        self.agent = AIAgent()
-        self.repo_owner = repo_owner or self._extract_repo_owner()
+        # Reusing the open Repo avoids re-reading .git/config, packed-refs
+        # and the pack indexes when a script creates many integrations
+        self.repo = _open_repo(os.path.realpath(repo_path))
+        self._agent = None
+        self._repo_owner_override = repo_owner
+    
+    @property
+    def agent(self) -> AIAgent:
+        """AI agent, created on first AI extraction (rule-based runs never need it)."""
+        if self._agent is None:
+            self._agent = AIAgent()
+        return self._agent
+    
+    @cached_property
+    def repo_owner(self) -> str:
+        """Repository owner: the one passed in, else parsed from the origin remote on first use."""
+        return self._repo_owner_override or self._extract_repo_owner()
     
     def _extract_repo_owner(self) -> str:
         """Try to extract repo owner from git remote."""
-        try:
-            remote = self.repo.remote()
-            url = remote.url
-            # Extract owner from common URL formats
-            if "github.com" in url:
-                parts = url.replace(".git", "").split("/")
-                if len(parts) >= 2:
-                    return parts[-2]
-            elif "git@" in url:
-                # SSH format: git@github.com:owner/repo.git
-                parts = url.split(":")
-                if len(parts) >= 2:
-                    repo_part = parts[1].replace(".git", "")
-                    return repo_part.split("/")[0]
-        except:
-            pass
+        url = _remote_url(self.repo)
+        if not url:
+            return "unknown"
+        
+        match = _URL_REMOTE_RE.match(url) or _SSH_REMOTE_RE.match(url)
+        if match:
+            return match.group(1)
         return "unknown"
     
+    def read_commit(self, commit_sha: str) -> Tuple[str, str, datetime]:
+        """
+        Read the fields extraction works on, without extracting.
+        
+        Callers that may extract the same commit more than once (e.g. to retry
+        a failed validation) read it once and pass the fields to the agent.
+        
+        Args:
+            commit_sha: Commit SHA (can be full or short SHA)
+            
+        Returns:
+            Tuple of (commit_message, repo_owner, date)
+        """
+        return self._commit_fields([_resolve_commit(self.repo, commit_sha)])[0]
+    
     def extract_from_commit_sha(
         self,
         commit_sha: str,
@@ -57,14 +175,115 @@ class GitIntegration:
         Returns:
             ExtractedInfo object
         """
-        commit = self.repo.commit(commit_sha)
+        return self._commit_extractor(use_ai)(*self.read_commit(commit_sha))
+    
+    def extract_from_commits(
+        self,
+        commit_shas: List[str],
+        use_ai: bool = True
+    ):
+        """
+        Extract information from several commits.
         
-        return self.agent.extract_from_commit(
-            commit_message=commit.message,
-            repo_owner=self.repo_owner,
-            date=datetime.fromtimestamp(commit.committed_date),
-            use_ai=use_ai
-        )
+        Commits are looked up with _resolve_commits (one history walk for
+        full SHAs) and extracted one after another; see
+        extract_from_commits_async for concurrent AI extraction.
+        
+        Args:
+            commit_shas: Commit SHAs (full or short) or other revisions
+            use_ai: Whether to use AI extraction
+            
+        Returns:
+            List of ExtractedInfo objects, in the order of commit_shas
+        """
+        extract = self._commit_extractor(use_ai)
+        return [extract(*fields) for fields in self._commit_fields(self._resolve_commits(commit_shas))]
+    
+    async def extract_from_commits_async(self, commit_shas: List[str], concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        AI extraction of several commits with the requests running concurrently.
+        
+        Args:
+            commit_shas: Commit SHAs (full or short) or other revisions
+            concurrency: Maximum simultaneous AI requests
+            
+        Returns:
+            List of ExtractedInfo objects, in the order of commit_shas
+        """
+        jobs = [(*fields, "commit") for fields in self._commit_fields(self._resolve_commits(commit_shas))]
+        return await self.agent.extract_many(jobs, concurrency)
+    
+    def extract_from_range(self, rev_range: str, use_ai: bool = True):
+        """
+        Extract information from every commit in a revision range.
+        
+        The range is read in a single history walk, e.g. all commits of a
+        release with "v1.0.0..v2.0.0".
+        
+        Args:
+            rev_range: Revision range "A..B" (commits reachable from B but not A),
+                       or a single revision for its whole history
+            use_ai: Whether to use AI extraction
+            
+        Returns:
+            List of ExtractedInfo objects, newest commit first
+        """
+        extract = self._commit_extractor(use_ai)
+        return [extract(*fields) for fields in self._commit_fields(_iter_range_commits(self.repo, rev_range))]
+    
+    async def extract_from_range_async(self, rev_range: str, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        AI extraction of a revision range with the requests running concurrently.
+        
+        Args:
+            rev_range: Revision range, as for extract_from_range
+            concurrency: Maximum simultaneous AI requests
+            
+        Returns:
+            List of ExtractedInfo objects, newest commit first
+        """
+        jobs = [(*fields, "commit") for fields in self._commit_fields(_iter_range_commits(self.repo, rev_range))]
+        return await self.agent.extract_many(jobs, concurrency)
+    
+    def _commit_fields(self, commits) -> list:
+        """(message, repo_owner, date) of each commit, in one pass with the owner and converters bound once."""
+        repo_owner = self.repo_owner
+        from_timestamp = datetime.fromtimestamp
+        return [(commit.message, repo_owner, from_timestamp(_commit_timestamp(commit))) for commit in commits]
+    
+    def _resolve_commits(self, commit_shas: List[str]) -> list:
+        """
+        Look up commits, in order, with a single history walk for full SHAs.
+        
+        Full SHAs are found in one walk of the history reachable from HEAD,
+        which streams commits out of the pack files in order instead of
+        looking each one up separately. Short SHAs, refs and commits not
+        reachable from HEAD are resolved individually.
+        """
+        wanted = {sha.lower() for sha in commit_shas if _FULL_SHA_RE.match(sha.lower())}
+        found = {}
+        if len(wanted) > 1:
+            for hexsha, commit in _iter_head_commits(self.repo):
+                if hexsha in wanted:
+                    found[hexsha] = commit
+                    if len(found) == len(wanted):
+                        break
+        
+        return [found.get(sha.lower()) or _resolve_commit(self.repo, sha) for sha in commit_shas]
+    
+    def _commit_extractor(self, use_ai: bool):
+        """
+        Return the function that extracts a commit's information.
+        
+        Both take (commit_message, repo_owner, date); the rule-based one is
+        returned without creating the AI agent. The message is passed as the
+        str both backends decode once (invalid bytes replaced): the rule-based
+        regexes and the AI prompt both need text, so raw bytes would only
+        move that decode downstream.
+        """
+        if use_ai:
+            return self.agent.extract_from_commit
+        return rule_based_extract_commit
     
     def extract_from_head(self, use_ai: bool = True):
         """
@@ -1,13 +1,22 @@
 """
 GitHub integration for fetching pull requests and commits.
 """
-from typing import Optional
+import asyncio
+from functools import cache
+from typing import List, Optional, Tuple
 from datetime import datetime
 from github import Github
 from github.PullRequest import PullRequest
 from github.Commit import Commit
-from config import Config
-from ai_agent import AIAgent
+from .config import Config
+from .ai_agent import AIAgent, pr_text
+from .extractors import rule_based_extract_commit, rule_based_extract_pr
+
+
+@cache
+def _get_github(token: str) -> Github:
+    """Return a GitHub client shared by all integrations, reusing its HTTP connections."""
+    return Github(token)
 
 
 class GitHubIntegration:
@@ -15,8 +24,58 @@ class GitHubIntegration:
     
     def __init__(self):
         """Initialize GitHub client."""
-        self.github = Github(Config.GITHUB_TOKEN) if Config.GITHUB_TOKEN else None
-        self.agent = AIAgent()
+        self.github = _get_github(Config.GITHUB_TOKEN) if Config.GITHUB_TOKEN else None
+        self._agent = None
+        # Repository objects by "owner/repo"; get_repo is an API round trip
+        self._repos = {}
+    
+    @property
+    def agent(self) -> AIAgent:
+        """AI agent, created on first AI extraction (rule-based runs never need it)."""
+        if self._agent is None:
+            self._agent = AIAgent()
+        return self._agent
+    
+    def _get_repo(self, repo_name: str):
+        """Fetch a repository once and reuse it for later PRs and commits."""
+        if not self.github:
+            raise ValueError("GitHub token is required. Set GITHUB_TOKEN in .env file.")
+        
+        repo = self._repos.get(repo_name)
+        if repo is None:
+            repo = self._repos[repo_name] = self.github.get_repo(repo_name)
+        return repo
+    
+    def read_pr(self, repo_name: str, pr_number: int) -> Tuple[str, str, str, datetime]:
+        """
+        Fetch the fields extraction works on, without extracting.
+        
+        Callers that may extract the same PR more than once (e.g. to retry a
+        failed validation) fetch it once and pass the fields to the agent.
+        
+        Args:
+            repo_name: Repository name in format "owner/repo"
+            pr_number: Pull request number
+            
+        Returns:
+            Tuple of (title, body, repo_owner, date)
+        """
+        pr = self._get_repo(repo_name).get_pull(pr_number)
+        return pr.title, pr.body or "", repo_name.split("/")[0], pr.created_at
+    
+    def read_commit(self, repo_name: str, commit_sha: str) -> Tuple[str, str, datetime]:
+        """
+        Fetch a commit's extraction fields, as read_pr does for a PR.
+        
+        Args:
+            repo_name: Repository name in format "owner/repo"
+            commit_sha: Commit SHA
+            
+        Returns:
+            Tuple of (commit_message, repo_owner, date)
+        """
+        commit = self._get_repo(repo_name).get_commit(commit_sha).commit
+        return commit.message, repo_name.split("/")[0], commit.author.date
     
     def extract_from_pr_number(
         self,
@@ -35,22 +94,10 @@ class GitHubIntegration:
         Returns:
             ExtractedInfo object
         """
-        if not self.github:
-            raise ValueError("GitHub token is required. Set GITHUB_TOKEN in .env file.")
-        
-        repo = self.github.get_repo(repo_name)
-        pr = repo.get_pull(pr_number)
-        
-        # Extract repo owner from repo_name
-        repo_owner = repo_name.split("/")[0]
-        
-        return self.agent.extract_from_pr(
-            title=pr.title,
-            body=pr.body or "",
-            repo_owner=repo_owner,
-            date=pr.created_at,
-            use_ai=use_ai
-        )
+        fields = self.read_pr(repo_name, pr_number)
+        if not use_ai:
+            return rule_based_extract_pr(*fields)
+        return self.agent.extract_from_pr(*fields)
     
     def extract_from_commit_sha(
         self,
@@ -69,18 +116,70 @@ class GitHubIntegration:
         Returns:
             ExtractedInfo object
         """
-        if not self.github:
-            raise ValueError("GitHub token is required. Set GITHUB_TOKEN in .env file.")
+        fields = self.read_commit(repo_name, commit_sha)
+        if not use_ai:
+            return rule_based_extract_commit(*fields)
+        return self.agent.extract_from_commit(*fields)
+    
+    async def extract_from_pr_numbers_async(
+        self,
+        repo_name: str,
+        pr_numbers: List[int],
+        use_ai: bool = True
+    ):
+        """
+        Extract information from several pull requests concurrently.
+        
+        All PRs are fetched first, with the blocking PyGithub requests
+        overlapping in worker threads; AI extraction then runs through
+        AIAgent.extract_many with its bounded number of requests in flight.
+        
+        Args:
+            repo_name: Repository name in format "owner/repo"
+            pr_numbers: Pull request numbers
+            use_ai: Whether to use AI extraction
+            
+        Returns:
+            List of ExtractedInfo objects, in the order of pr_numbers
+        """
+        repo = self._get_repo(repo_name)
+        repo_owner = repo_name.split("/")[0]
+        prs = await asyncio.gather(*(
+            asyncio.to_thread(repo.get_pull, pr_number) for pr_number in pr_numbers
+        ))
         
-        repo = self.github.get_repo(repo_name)
-        commit = repo.get_commit(commit_sha)
+        if not use_ai:
+            return [rule_based_extract_pr(pr.title, pr.body or "", repo_owner, pr.created_at) for pr in prs]
+        return await self.agent.extract_many([
+            (pr_text(pr.title, pr.body or ""), repo_owner, pr.created_at, "pull request")
+            for pr in prs
+        ])
+    
+    async def extract_from_commit_shas_async(
+        self,
+        repo_name: str,
+        commit_shas: List[str],
+        use_ai: bool = True
+    ):
+        """
+        Extract information from several commits concurrently.
         
-        # Extract repo owner from repo_name
+        Args:
+            repo_name: Repository name in format "owner/repo"
+            commit_shas: Commit SHAs
+            use_ai: Whether to use AI extraction
+            
+        Returns:
+            List of ExtractedInfo objects, in the order of commit_shas
+        """
+        repo = self._get_repo(repo_name)
         repo_owner = repo_name.split("/")[0]
+        commits = [commit.commit for commit in await asyncio.gather(*(
+            asyncio.to_thread(repo.get_commit, commit_sha) for commit_sha in commit_shas
+        ))]
         
-        return self.agent.extract_from_commit(
-            commit_message=commit.commit.message,
-            repo_owner=repo_owner,
-            date=commit.commit.author.date,
-            use_ai=use_ai
-        )
+        if not use_ai:
+            return [rule_based_extract_commit(commit.message, repo_owner, commit.author.date) for commit in commits]
+        return await self.agent.extract_many([
+            (commit.message, repo_owner, commit.author.date, "commit") for commit in commits
+        ])
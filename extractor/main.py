@@ -3,15 +3,144 @@ Main entry point for the AI agent.
 """
 import json
 import sys
-import argparse
 from datetime import datetime
-from ai_agent import AIAgent
-from github_integration import GitHubIntegration
-from git_integration import GitIntegration
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Separator line of the pretty output
+_RULE = "=" * 50
+
+
+# Option combinations accepted by each --source (any one combination must be
+# fully given), with the usage error shown otherwise
+_REQUIRED_OPTIONS = {
+    "commit": (
+        (("sha", "repo"), ("message", "repo_owner")),
+        "For commit: provide either (--sha and --repo) or (--message and --repo-owner)"
+    ),
+    "pr": ((("message", "repo_owner"),), "For pr: --message and --repo-owner are required"),
+    "github-pr": ((("repo", "pr_number"),), "For github-pr: --repo and --pr-number are required"),
+    "github-commit": ((("repo", "sha"),), "For github-commit: --repo and --sha are required"),
+}
+
+
+# Heavy integrations (gitpython, PyGithub, openai) and asyncio are imported
+# only in the handler that needs them, so --help, argument errors and
+# rule-based extraction from a message stay fast
+
+def _extract_commit(args, use_ai: bool) -> list:
+    """Local commit extraction, by SHA(s) from a repository or from a message."""
+    if args.sha and args.repo:
+        from .git_integration import GitIntegration
+        git = GitIntegration(args.repo, repo_owner=args.repo_owner)
+        if use_ai and len(args.sha) > 1:
+            # Several commits: keep multiple AI requests in flight
+            import asyncio
+            return asyncio.run(git.extract_from_commits_async(args.sha))
+        return git.extract_from_commits(args.sha, use_ai=use_ai)
+    
+    date = args.date or datetime.now()
+    if use_ai:
+        from .ai_agent import AIAgent
+        return [AIAgent().extract_from_commit(
+            commit_message=args.message,
+            repo_owner=args.repo_owner,
+            date=date
+        )]
+    # Rule-based only: no API key needed, OpenAI SDK never loaded
+    from .extractors import rule_based_extract_commit
+    return [rule_based_extract_commit(args.message, args.repo_owner, date)]
+
+
+def _extract_pr(args, use_ai: bool) -> list:
+    """Local PR extraction from a title and body."""
+    date = args.date or datetime.now()
+    if use_ai:
+        from .ai_agent import AIAgent
+        return [AIAgent().extract_from_pr(
+            title=args.message,
+            body=args.body or "",
+            repo_owner=args.repo_owner,
+            date=date
+        )]
+    from .extractors import rule_based_extract_pr
+    return [rule_based_extract_pr(args.message, args.body or "", args.repo_owner, date)]
+
+
+def _extract_github_pr(args, use_ai: bool) -> list:
+    """GitHub PR extraction; several PRs are fetched concurrently."""
+    import asyncio
+    from .github_integration import GitHubIntegration
+    return asyncio.run(GitHubIntegration().extract_from_pr_numbers_async(
+        repo_name=args.repo,
+        pr_numbers=args.pr_number,
+        use_ai=use_ai
+    ))
+
+
+def _extract_github_commit(args, use_ai: bool) -> list:
+    """GitHub commit extraction; several commits are fetched concurrently."""
+    import asyncio
+    from .github_integration import GitHubIntegration
+    return asyncio.run(GitHubIntegration().extract_from_commit_shas_async(
+        repo_name=args.repo,
+        commit_shas=args.sha,
+        use_ai=use_ai
+    ))
+
+
+def _to_json(result) -> dict:
+    """
+    Project an ExtractedInfo onto its JSON output fields.
+    
+    Reads the four fields directly rather than walking the model with
+    model_dump; the date is written in ISO 8601 form.
+    """
+    return {
+        "repo_owner": result.repo_owner,
+        "date": result.date.isoformat(),
+        "version_change": result.version_change,
+        "description": result.description
+    }
+
+
+def _expected_errors() -> tuple:
+    """
+    Exception types reported as a one-line error instead of a traceback.
+    
+    Library exceptions are included only if that library was imported,
+    so this never triggers a heavy import itself.
+    """
+    # Bad input or config, unknown revision, I/O and network, missing dependency
+    errors = [ValueError, KeyError, OSError, ImportError]
+    for module_name, attribute in (
+        ("git", "GitError"),             # GitPython, e.g. not a git repository
+        ("gitdb.exc", "ODBError"),       # GitPython: unknown commit SHA
+        ("pygit2", "GitError"),
+        ("github", "GithubException"),   # PyGithub API errors
+    ):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            errors.append(getattr(module, attribute))
+    return tuple(errors)
+
+
+_HANDLERS = {
+    "commit": _extract_commit,
+    "pr": _extract_pr,
+    "github-pr": _extract_github_pr,
+    "github-commit": _extract_github_commit,
+}
 
 
 def main():
     """Main function to run the AI agent."""
+    # Imported here so scripts importing this module do not pay for argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Extract information from pull requests or commits"
     )
@@ -43,14 +172,15 @@ def main():
     
     parser.add_argument(
         "--date",
-        type=str,
+        type=datetime.fromisoformat,
         help="Date in ISO format (YYYY-MM-DDTHH:MM:SS)"
     )
     
     parser.add_argument(
         "--sha",
         type=str,
-        help="Commit SHA (for commit or github-commit)"
+        nargs="+",
+        help="Commit SHA(s) (for commit or github-commit)"
     )
     
     parser.add_argument(
@@ -62,7 +192,8 @@ def main():
     parser.add_argument(
         "--pr-number",
         type=int,
-        help="Pull request number (for github-pr)"
+        nargs="+",
+        help="Pull request number(s) (for github-pr)"
     )
     
     parser.add_argument(
@@ -80,79 +211,40 @@ def main():
     
     args = parser.parse_args()
     
-    use_ai = not args.no_ai
+    # Each source needs one of its option combinations; checked once, up front
+    combinations, message = _REQUIRED_OPTIONS[args.source]
+    if not any(all(getattr(args, option) for option in combo) for combo in combinations):
+        parser.error(message)
     
     try:
-        if args.source == "commit":
-            # Local commit extraction
-            if args.sha and args.repo:
-                git = GitIntegration(args.repo, repo_owner=args.repo_owner)
-                result = git.extract_from_commit_sha(args.sha, use_ai=use_ai)
-            elif args.message and args.repo_owner:
-                date = datetime.fromisoformat(args.date) if args.date else datetime.now()
-                agent = AIAgent()
-                result = agent.extract_from_commit(
-                    commit_message=args.message,
-                    repo_owner=args.repo_owner,
-                    date=date,
-                    use_ai=use_ai
-                )
-            else:
-                parser.error("For commit: provide either (--sha and --repo) or (--message and --repo-owner)")
-        
-        elif args.source == "pr":
-            # Local PR extraction
-            if not args.message or not args.repo_owner:
-                parser.error("For pr: --message and --repo-owner are required")
-            
-            date = datetime.fromisoformat(args.date) if args.date else datetime.now()
-            agent = AIAgent()
-            result = agent.extract_from_pr(
-                title=args.message,
-                body=args.body or "",
-                repo_owner=args.repo_owner,
-                date=date,
-                use_ai=use_ai
-            )
-        
-        elif args.source == "github-pr":
-            # GitHub PR extraction
-            if not args.repo or not args.pr_number:
-                parser.error("For github-pr: --repo and --pr-number are required")
-            
-            github = GitHubIntegration()
-            result = github.extract_from_pr_number(
-                repo_name=args.repo,
-                pr_number=args.pr_number,
-                use_ai=use_ai
-            )
-        
-        elif args.source == "github-commit":
-            # GitHub commit extraction
-            if not args.repo or not args.sha:
-                parser.error("For github-commit: --repo and --sha are required")
-            
-            github = GitHubIntegration()
-            result = github.extract_from_commit_sha(
-                repo_name=args.repo,
-                commit_sha=args.sha,
-                use_ai=use_ai
-            )
+        results = _HANDLERS[args.source](args, not args.no_ai)
         
         # Output results
         if args.output == "json":
-            print(json.dumps(result.dict(), indent=2, default=str))
+            # A single result keeps the one-object output, several become a list
+            data = [_to_json(result) for result in results]
+            if len(data) == 1:
+                data = data[0]
+            if orjson is not None:
+                sys.stdout.flush()
+                sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+                sys.stdout.buffer.flush()
+            else:
+                print(json.dumps(data, indent=2))
         else:
-            print("\n" + "="*50)
-            print("EXTRACTED INFORMATION")
-            print("="*50)
-            print(f"Repository Owner: {result.repo_owner}")
-            print(f"Date: {result.date}")
-            print(f"Version Change: {result.version_change or 'Not specified'}")
-            print(f"Description: {result.description}")
-            print("="*50 + "\n")
-    
-    except Exception as e:
+            # One write per result instead of a print per line
+            for result in results:
+                sys.stdout.write(
+                    f"\n{_RULE}\nEXTRACTED INFORMATION\n{_RULE}\n"
+                    f"Repository Owner: {result.repo_owner}\n"
+                    f"Date: {result.date}\n"
+                    f"Version Change: {result.version_change or 'Not specified'}\n"
+                    f"Description: {result.description}\n"
+                    f"{_RULE}\n\n"
+                )
+    
+    except _expected_errors() as e:
+        # Anything unexpected propagates with its full traceback
         print(f"Error: {e}", file=sys.stderr)
         return 1
     
@@ -12,8 +12,3 @@ class ExtractedInfo(BaseModel):
     date: datetime
     version_change: Optional[str] = None
     description: str
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
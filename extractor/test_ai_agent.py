@@ -0,0 +1,125 @@
+"""
+Test script for the AI agent's rule-based shortcut and concurrent extraction.
+"""
+import asyncio
+import json
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from extractor.ai_agent import AIAgent
+from extractor.config import Config
+
+
+class _FakeStream:
+    """Streamed reply holding the whole JSON answer in one chunk."""
+    
+    def __init__(self, content):
+        self._chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])]
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def __aiter__(self):
+        return self._iterate()
+    
+    async def _iterate(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _FakeAsyncOpenAI:
+    """Stand-in for openai.AsyncOpenAI, usable only in the event loop that created it."""
+    
+    instances = []
+    
+    def __init__(self, api_key=None, max_retries=None):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.instances.append(self)
+    
+    async def _create(self, **request):
+        if self.closed or asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("Event loop is closed")
+        self.requests.append(request)
+        return _FakeStream(json.dumps({
+            "repo_owner": "microsoft",
+            "version_change": "1.0.0",
+            "description": "Fix login redirect loop"
+        }))
+    
+    async def close(self):
+        self.closed = True
+
+
+@contextmanager
+def _fake_agent():
+    """AIAgent whose AsyncOpenAI is _FakeAsyncOpenAI, without needing an API key."""
+    saved_module, saved_key = sys.modules.get("openai"), Config.OPENAI_API_KEY
+    _FakeAsyncOpenAI.instances = []
+    sys.modules["openai"] = SimpleNamespace(OpenAI=lambda **kwargs: None, AsyncOpenAI=_FakeAsyncOpenAI)
+    Config.OPENAI_API_KEY = "test-key"
+    try:
+        yield AIAgent()
+    finally:
+        Config.OPENAI_API_KEY = saved_key
+        if saved_module is None:
+            del sys.modules["openai"]
+        else:
+            sys.modules["openai"] = saved_module
+
+
+def test_confident_release_line_skips_ai():
+    """A "vX.Y.Z: description" commit is answered without the AI."""
+    info = AIAgent._confident_rule_based(
+        "v1.2.3: Fix login redirect loop", "microsoft", datetime(2024, 1, 15), "commit"
+    )
+    
+    assert info is not None
+    assert info.version_change == "1.2.3"
+    assert info.description == "Fix login redirect loop"
+
+
+def test_arrow_release_line_goes_to_ai():
+    """A half-parsed "A -> B: description" commit is left to the AI."""
+    info = AIAgent._confident_rule_based(
+        "v2.0.0 -> v2.0.1: Patch session timeout handling", "microsoft", datetime(2024, 1, 15), "commit"
+    )
+    
+    assert info is None
+
+
+def test_missing_version_goes_to_ai():
+    """A commit without a version is left to the AI."""
+    info = AIAgent._confident_rule_based(
+        "Fix login redirect loop", "microsoft", datetime(2024, 1, 15), "commit"
+    )
+    
+    assert info is None
+
+
+def test_extract_many_uses_a_client_per_event_loop():
+    """Repeated asyncio.run calls on one agent each get a working async client."""
+    jobs = [("Fix login redirect loop", "microsoft", datetime(2024, 1, 15), "commit")] * 2
+    
+    with _fake_agent() as agent:
+        for _ in range(2):
+            results = asyncio.run(agent.extract_many(jobs))
+            # A rule-based fallback would have found no version
+            assert [info.version_change for info in results] == ["1.0.0", "1.0.0"]
+    
+    assert len(_FakeAsyncOpenAI.instances) == 2
+    assert all(client.closed and len(client.requests) == 2 for client in _FakeAsyncOpenAI.instances)
+
+
+if __name__ == "__main__":
+    test_confident_release_line_skips_ai()
+    test_arrow_release_line_goes_to_ai()
+    test_missing_version_goes_to_ai()
+    test_extract_many_uses_a_client_per_event_loop()
+    print("ALL TESTS COMPLETED")
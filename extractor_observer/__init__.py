@@ -0,0 +1,3 @@
+"""
+Observer agent that validates data extracted by the extractor agent.
+"""
@@ -0,0 +1,114 @@
+"""
+JSONL checkpoint that lets an interrupted observe_batch run resume.
+"""
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO, Union
+from .models import ExtractedData, ValidationResult
+from .json_utils import dumps, loads
+
+
+def item_fingerprint(extracted_data: ExtractedData) -> str:
+    """Hash of the validated fields, tying a checkpoint record to its item."""
+    parts = (
+        extracted_data.repo_owner or "",
+        extracted_data.date.isoformat() if extracted_data.date else "",
+        extracted_data.version_change or "",
+        extracted_data.description or ""
+    )
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+class BatchCheckpoint:
+    """Append-only record of finished batch items, one JSON line per item."""
+
+    def __init__(self, path: Union[str, Path], fingerprints: List[str]):
+        """
+        Load any results already recorded at ``path`` for this batch.
+
+        Args:
+            path: JSONL checkpoint file (created on the first recorded result)
+            fingerprints: item_fingerprint of each item in the batch being
+                          observed; records for other data are ignored
+        """
+        self.path = Path(path)
+        self.fingerprints = fingerprints
+        self.batch_size = len(fingerprints)
+        self._ends_mid_line = False
+        self.completed: Dict[int, ValidationResult] = self._load()
+        # Batch indices still to be validated, in input order
+        self.pending: List[int] = [i for i in range(self.batch_size) if i not in self.completed]
+        self._file: Optional[TextIO] = None
+
+    def _load(self) -> Dict[int, ValidationResult]:
+        """Read completed results of this batch, skipping a line left half-written by a crash."""
+        completed = {}
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    self._ends_mid_line = True
+                    break
+                try:
+                    record = loads(line)
+                except ValueError:
+                    continue
+                idx = record["idx"]
+                # A record from another batch (or an older checkpoint format)
+                # does not describe this batch's item at idx
+                if not (0 <= idx < self.batch_size and record.get("fp") == self.fingerprints[idx]):
+                    continue
+                result = record["result"]
+                completed[idx] = ValidationResult(
+                    is_valid=result["is_valid"],
+                    errors=tuple(result["errors"]),
+                    warnings=tuple(result["warnings"])
+                )
+        return completed
+
+    def record(self, idx: int, result: ValidationResult):
+        """
+        Append one finished item and flush it to disk.
+
+        Args:
+            idx: Index of the item in the full batch
+            result: Its validation result
+        """
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # Start on a fresh line if the previous run died mid-write
+            if self._ends_mid_line:
+                self._file.write("\n")
+
+        self._file.write(dumps({
+            "idx": idx,
+            "fp": self.fingerprints[idx],
+            "result": {
+                "is_valid": result.is_valid,
+                "errors": result.errors,
+                "warnings": result.warnings
+            }
+        }, indent=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        """Close the checkpoint file if it was opened."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def merge(self, new_results: List[ValidationResult]) -> List[ValidationResult]:
+        """
+        Combine loaded and newly computed results into input order.
+
+        Args:
+            new_results: Results for ``pending`` items, in the same order
+
+        Returns:
+            One ValidationResult per batch item
+        """
+        merged = dict(self.completed)
+        merged.update(zip(self.pending, new_results))
+        return [merged[i] for i in range(self.batch_size)]
@@ -0,0 +1,73 @@
+"""
+Configuration settings for the observer agent.
+"""
+import functools
+import os
+from dataclasses import dataclass
+from dotenv import load_dotenv
+
+
+@functools.cache
+def _load_dotenv_once() -> bool:
+    """Load .env at most once per process, never overriding variables already set."""
+    return load_dotenv(override=False)
+
+
+_load_dotenv_once()
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean environment variable ("true"/"false")."""
+    return os.getenv(name, default).lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Application configuration, resolved once at import time."""
+
+    # OpenAI Configuration (optional, for AI-powered validation)
+    OPENAI_API_KEY: str
+    OPENAI_MODEL: str
+    OPENAI_VALIDATOR_MODEL: str
+    OPENAI_TEMPERATURE: float
+
+    # Observer Configuration
+    STRICT_MODE: bool
+    ENABLE_AI_VALIDATION: bool
+    GENERATE_REPORTS: bool
+    REPORTS_DIR: str
+    DEFAULT_REPORT_FORMAT: str
+    MAX_RETRIES: int
+    AI_BATCH_SIZE: int
+    AI_MAX_CONCURRENT: int
+    AI_RPM_LIMIT: int
+    VALIDATION_WORKERS: int
+
+
+def _build_config() -> Config:
+    """Read all settings from the environment in a single pass."""
+    return Config(
+        OPENAI_API_KEY=os.getenv("OPENAI_API_KEY", ""),
+        OPENAI_MODEL=os.getenv("OPENAI_MODEL", "gpt-4"),
+        # Validation needs only a short JSON verdict, so a smaller model can be used
+        OPENAI_VALIDATOR_MODEL=os.getenv("OPENAI_VALIDATOR_MODEL") or os.getenv("OPENAI_MODEL", "gpt-4"),
+        OPENAI_TEMPERATURE=float(os.getenv("OPENAI_TEMPERATURE", "0.3")),
+        STRICT_MODE=_env_flag("OBSERVER_STRICT_MODE", "true"),
+        ENABLE_AI_VALIDATION=_env_flag("ENABLE_AI_VALIDATION", "false"),
+        GENERATE_REPORTS=_env_flag("GENERATE_REPORTS", "true"),
+        REPORTS_DIR=os.getenv("REPORTS_DIR", "reports"),
+        DEFAULT_REPORT_FORMAT=os.getenv("DEFAULT_REPORT_FORMAT", "text"),
+        MAX_RETRIES=int(os.getenv("MAX_RETRIES", "2")),
+        # Number of items sent per AI validation request in batch observation
+        AI_BATCH_SIZE=max(1, int(os.getenv("AI_BATCH_SIZE", "10"))),
+        # Client-side throttling of AI requests (an RPM limit of 0 disables it)
+        AI_MAX_CONCURRENT=max(1, int(os.getenv("AI_MAX_CONCURRENT", "8"))),
+        AI_RPM_LIMIT=int(os.getenv("AI_RPM_LIMIT", "500")),
+        # Worker processes for rule-based checks of very large batches when
+        # pandas is not installed (1 keeps validation in-process)
+        VALIDATION_WORKERS=max(1, int(os.getenv("VALIDATION_WORKERS", "1"))),
+    )
+
+
+# Shared, immutable configuration instance
+CONFIG = _build_config()
@@ -1,19 +1,40 @@
 """
 Example of integrating the observer agent with the extractor agent.
 """
+import asyncio
+import io
 import sys
-import os
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
-
-# Add extractor directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'extractor'))
+from typing import List, Tuple
 
 from extractor.ai_agent import AIAgent
 from extractor.models import ExtractedInfo
-from models import ExtractedData
-from observer_agent import ObserverAgent
+from extractor_observer.models import ExtractedData
+from extractor_observer.observer_agent import ObserverAgent
+
+
+@contextmanager
+def _buffered_stdout():
+    """
+    Collect the example's prints and write them in one call at the end.
+    
+    Only when stdout is piped or redirected; on a terminal each line is
+    still shown as soon as it is printed.
+    """
+    if sys.stdout.isatty():
+        yield
+        return
+    
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
 
 
+@_buffered_stdout()
 def extract_and_observe_commit(commit_message: str, repo_owner: str, date: datetime):
     """
     Extract information from a commit and observe/validate it.
@@ -97,6 +118,7 @@ def extract_and_observe_commit(commit_message: str, repo_owner: str, date: datet
     print()
 
 
+@_buffered_stdout()
 def extract_and_observe_pr(title: str, body: str, repo_owner: str, date: datetime):
     """
     Extract information from a PR and observe/validate it.
@@ -161,6 +183,52 @@ def extract_and_observe_pr(title: str, body: str, repo_owner: str, date: datetim
     print("\n✓ All checks passed - extraction is valid!")
 
 
+@_buffered_stdout()
+def extract_and_observe_commits(commits: List[Tuple[str, str, datetime]]):
+    """
+    Extract and validate many commits in three bulk passes.
+    
+    Rather than extracting, validating and printing one commit at a time,
+    all AI extractions run concurrently, the results are validated in one
+    observe_batch call, and only a summary is printed.
+    
+    Args:
+        commits: (commit_message, repo_owner, date) tuples
+    """
+    print("=" * 60)
+    print("BULK EXTRACTION AND OBSERVATION EXAMPLE")
+    print("=" * 60)
+    print(f"\nCommits: {len(commits)}\n")
+    
+    # Pass 1: build the extraction jobs
+    jobs = [(message, repo_owner, date, "commit") for message, repo_owner, date in commits]
+    
+    # Pass 2: extract everything with concurrent AI requests
+    print("Step 1: Extracting all commits...")
+    extractor = AIAgent()
+    extracted = asyncio.run(extractor.extract_many(jobs))
+    print(f"✓ Extracted {len(extracted)} commits")
+    
+    # Pass 3: validate the whole list at once
+    print("\nStep 2: Validating all extractions...")
+    observer = ObserverAgent(strict_mode=False)
+    results = observer.observe_batch(
+        [ExtractedData.from_extracted_info(info) for info in extracted],
+        source_contexts=[{"type": "commit", "repo_owner": repo_owner} for _, repo_owner, _ in commits]
+    )
+    
+    for (message, _, _), result in zip(commits, results):
+        if not result.is_valid:
+            print(f"✗ {message[:50]}: {', '.join(result.errors)}")
+    
+    summary = observer.get_validation_summary()
+    print(f"\n  Total validations: {summary['total_validations']}")
+    print(f"  Passed: {summary['passed']}")
+    print(f"  Failed: {summary['failed']}")
+    print(f"  Pass rate: {summary['pass_rate']:.1f}%")
+    print()
+
+
 if __name__ == "__main__":
     # Example 1: Valid commit
     print("\n" + "=" * 60)
@@ -182,3 +250,13 @@ if __name__ == "__main__":
         repo_owner="github",
         date=datetime.now()
     )
+    
+    # Example 3: Several commits in bulk
+    print("\n" + "=" * 60)
+    print("EXAMPLE 3: Bulk Commits")
+    print("=" * 60 + "\n")
+    extract_and_observe_commits([
+        ("Release: version bump 1.2.3 -> 2.0.0 - Added new authentication system", "microsoft", datetime.now()),
+        ("Fix typo in README", "microsoft", datetime.now()),
+        ("v2.0.0 -> v2.0.1: Patch session timeout handling", "microsoft", datetime.now()),
+    ])
@@ -0,0 +1,56 @@
+"""
+JSON helpers that use orjson when it is installed.
+"""
+import json
+from collections.abc import Mapping
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON encoder does not handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Mapping):  # e.g. a ChainMap overlay of a source context
+        return dict(value)
+    return str(value)
+
+
+def _orjson_option(indent: bool) -> int:
+    """orjson option flags matching the stdlib output of dumps."""
+    option = orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize to JSON (indented by default), encoding datetimes as ISO 8601 strings."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_orjson_option(indent), default=_default).decode()
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        default=_default
+    )
+
+
+def dumpb(obj: Any, indent: bool = True) -> bytes:
+    """As dumps, but UTF-8 encoded; with orjson this skips the decode to str."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_orjson_option(indent), default=_default)
+    return dumps(obj, indent).encode("utf-8")
+
+
+def loads(data: Any) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,23 @@
+"""
+Console logging for the observer's command-line entry points.
+"""
+import logging
+
+
+def log_to_console(level: int = logging.INFO):
+    """
+    Print the observer's log messages (e.g. generated report paths) to stderr.
+
+    Only the extractor_observer package logger is configured; the root logger
+    is left alone, so third-party INFO logging (httpx logs every OpenAI
+    request) stays off.
+
+    Args:
+        level: Lowest level of observer messages to print
+    """
+    logger = logging.getLogger(__package__)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(level)
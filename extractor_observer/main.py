@@ -0,0 +1,199 @@
+"""
+Main entry point for the observer agent.
+"""
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Optional
+from .json_utils import dumpb
+from .log_utils import log_to_console
+
+
+# Command-line options as (flag, argparse keyword arguments). Both the
+# argparse parser and the fast parser below are built from this table
+_OPTIONS = (
+    ("--repo-owner", {"type": str, "required": True, "help": "Repository owner name"}),
+    ("--date", {"type": str, "required": True, "help": "Date in ISO format (YYYY-MM-DDTHH:MM:SS)"}),
+    ("--description", {"type": str, "required": True, "help": "Description of change"}),
+    ("--version-change", {"type": str, "default": None, "help": "Version change (e.g., '1.2.3 -> 2.0.0')"}),
+    ("--strict", {"action": "store_true", "help": "Enable strict mode (raises exceptions on validation failure)"}),
+    ("--no-strict", {"action": "store_true", "help": "Disable strict mode"}),
+    ("--ai", {"action": "store_true", "help": "Enable AI-powered validation"}),
+    ("--output", {"choices": ["json", "pretty"], "default": "pretty", "help": "Output format"}),
+    ("--summary", {"action": "store_true", "help": "Show validation summary"}),
+    ("--report-format", {"choices": ["text", "json", "html"], "default": "text",
+                         "help": "Report format when validation fails"}),
+    ("--no-reports", {"action": "store_true", "help": "Disable report generation"}),
+    ("--generate-summary-report", {"action": "store_true", "help": "Generate summary report of all validations"}),
+    ("--max-retries", {"type": int, "default": 2, "help": "Maximum number of retry attempts (default: 2)"}),
+    ("--no-retry", {"action": "store_true", "help": "Disable retry functionality"}),
+)
+
+
+def _dest(flag: str) -> str:
+    """Attribute name argparse gives an option (e.g. --repo-owner -> repo_owner)."""
+    return flag[2:].replace("-", "_")
+
+
+# The fast parser's view of _OPTIONS: value options mapped to their
+# attribute name, default and type, and flags mapped to their attribute name
+_VALUE_OPTIONS = {
+    flag: (_dest(flag), kwargs.get("default"), kwargs.get("type", str))
+    for flag, kwargs in _OPTIONS if kwargs.get("action") != "store_true"
+}
+_FLAG_OPTIONS = {flag: _dest(flag) for flag, kwargs in _OPTIONS if kwargs.get("action") == "store_true"}
+_CHOICES = {_dest(flag): kwargs["choices"] for flag, kwargs in _OPTIONS if "choices" in kwargs}
+_REQUIRED = tuple(_dest(flag) for flag, kwargs in _OPTIONS if kwargs.get("required"))
+
+
+def _fast_parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse well-formed ``--option value`` arguments without importing argparse.
+
+    Args:
+        argv: Command-line arguments, without the program name
+
+    Returns:
+        The parsed arguments, or None when argparse is needed (help, an
+        unknown or abbreviated option, a missing or invalid value)
+    """
+    values = {name: default for name, default, _ in _VALUE_OPTIONS.values()}
+    values.update(dict.fromkeys(_FLAG_OPTIONS.values(), False))
+
+    i = 0
+    while i < len(argv):
+        option = argv[i]
+        if option in _FLAG_OPTIONS:
+            values[_FLAG_OPTIONS[option]] = True
+            i += 1
+        elif option in _VALUE_OPTIONS and i + 1 < len(argv) and not argv[i + 1].startswith("-"):
+            name, _, value_type = _VALUE_OPTIONS[option]
+            try:
+                value = value_type(argv[i + 1])
+            except ValueError:
+                return None
+            if name in _CHOICES and value not in _CHOICES[name]:
+                return None
+            values[name] = value
+            i += 2
+        else:
+            return None
+
+    if any(values[name] is None for name in _REQUIRED):
+        return None
+    return SimpleNamespace(**values)
+
+
+def _build_parser():
+    """Build the argparse parser from _OPTIONS."""
+    # argparse is only imported for help output and error reporting
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Observe and validate data extraction from the extractor agent"
+    )
+    for flag, kwargs in _OPTIONS:
+        parser.add_argument(flag, **kwargs)
+    return parser
+
+
+def _parse_args():
+    """Parse the command line, falling back to argparse for anything unusual."""
+    args = _fast_parse_args(sys.argv[1:])
+    if args is not None:
+        return args
+    return _build_parser().parse_args()
+
+
+def main():
+    """Main function to run the observer agent."""
+    args = _parse_args()
+    
+    # The observer reports progress (e.g. generated report paths) through logging
+    log_to_console()
+    
+    # Heavy imports (pydantic, openai) are deferred until arguments are valid
+    from .models import ExtractedData
+    from .observer_agent import ObserverAgent
+    
+    try:
+        # Parse date
+        date = datetime.fromisoformat(args.date)
+        
+        # Create extracted data object
+        extracted_data = ExtractedData(
+            repo_owner=args.repo_owner,
+            date=date,
+            version_change=args.version_change,
+            description=args.description
+        )
+        
+        # Determine strict mode
+        strict_mode = args.strict if args.strict else (not args.no_strict)
+        
+        # Create observer agent
+        max_retries = 0 if args.no_retry else args.max_retries
+        observer = ObserverAgent(
+            strict_mode=strict_mode,
+            use_ai=args.ai,
+            generate_reports=not args.no_reports,
+            max_retries=max_retries
+        )
+        
+        # Observe and validate
+        try:
+            result = observer.observe_extraction(extracted_data)
+            
+            if args.output == "json":
+                output = {
+                    "is_valid": result.is_valid,
+                    "errors": result.errors,
+                    "warnings": result.warnings,
+                    "extracted_data": {
+                        "repo_owner": extracted_data.repo_owner,
+                        "date": extracted_data.date,
+                        "version_change": extracted_data.version_change,
+                        "description": extracted_data.description
+                    }
+                }
+                # Written as bytes, so orjson output is never decoded
+                sys.stdout.flush()
+                sys.stdout.buffer.write(dumpb(output) + b"\n")
+                sys.stdout.buffer.flush()
+            else:
+                print("\n" + "="*50)
+                print("OBSERVATION RESULT")
+                print("="*50)
+                print(str(result))
+                print("="*50 + "\n")
+            
+            if args.summary:
+                summary = observer.get_validation_summary()
+                print("\n" + "="*50)
+                print("VALIDATION SUMMARY")
+                print("="*50)
+                for key, value in summary.items():
+                    print(f"{key}: {value}")
+                print("="*50 + "\n")
+            
+            # Generate summary report if requested
+            if args.generate_summary_report:
+                summary_report_path = observer.generate_summary_report(format=args.report_format)
+                if summary_report_path:
+                    print(f"\nSummary report generated: {summary_report_path}")
+                else:
+                    print("\nNo failed validations to report.")
+            
+            return 0 if result.is_valid else 1
+        
+        except ValueError as e:
+            print(f"Validation Error: {e}", file=sys.stderr)
+            return 1
+    
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Data models for observer validation.
+"""
+from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """
+    Result of validation check (built internally, so no pydantic validation).
+    
+    Immutable, messages included: results are shared (CLEAN_RESULT, cached
+    rule-based results), so a caller must not be able to alter another's.
+    """
+    is_valid: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...] = ()
+    
+    def __str__(self):
+        """String representation of validation result."""
+        status = "VALID" if self.is_valid else "INVALID"
+        lines = [f"Validation Status: {status}"]
+        
+        if self.errors:
+            lines.append(f"Errors ({len(self.errors)}):")
+            lines.extend(f"  - {error}" for error in self.errors)
+        
+        if self.warnings:
+            lines.append(f"Warnings ({len(self.warnings)}):")
+            lines.extend(f"  - {warning}" for warning in self.warnings)
+        
+        return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class ValidationRecord:
+    """One entry in an observer's validation history."""
+    timestamp_ns: int
+    repo_owner: str
+    date: datetime
+    version_change: Optional[str]
+    is_valid: bool
+    errors: Tuple[str, ...]
+    warnings: Tuple[str, ...]
+    source_context: Optional[Dict[str, Any]]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict with a wall-clock ``timestamp``."""
+        return {
+            "timestamp": datetime.fromtimestamp(self.timestamp_ns / 1e9),
+            "repo_owner": self.repo_owner,
+            "date": self.date,
+            "version_change": self.version_change,
+            "is_valid": self.is_valid,
+            "errors": list(self.errors),
+            "warnings": list(self.warnings),
+            "source_context": self.source_context
+        }
+
+
+class ExtractedData(BaseModel):
+    """Model for extracted data from the extractor agent."""
+    repo_owner: str
+    date: datetime
+    version_change: Optional[str] = None
+    description: str
+    
+    @classmethod
+    def from_extracted_info(cls, extracted_info: Any) -> "ExtractedData":
+        """
+        Convert extractor output to an ExtractedData model.
+        
+        Output whose fields already have the model's types (e.g. a validated
+        ExtractedInfo) is wrapped with model_construct, skipping a second round
+        of pydantic validation; anything else goes through full validation.
+        
+        Args:
+            extracted_info: Object with repo_owner, date, version_change and description
+            
+        Returns:
+            ExtractedData model
+        """
+        if isinstance(extracted_info, cls):
+            return extracted_info
+        
+        repo_owner = extracted_info.repo_owner
+        date = extracted_info.date
+        version_change = extracted_info.version_change
+        description = extracted_info.description
+        
+        if (
+            type(repo_owner) is str
+            and type(description) is str
+            and isinstance(date, datetime)
+            and (version_change is None or type(version_change) is str)
+        ):
+            return cls.model_construct(
+                repo_owner=repo_owner,
+                date=date,
+                version_change=version_change,
+                description=description
+            )
+        
+        return cls(
+            repo_owner=repo_owner,
+            date=date,
+            version_change=version_change,
+            description=description
+        )
@@ -0,0 +1,1068 @@
+"""
+Observer agent for monitoring and validating extractor agent output.
+"""
+import asyncio
+import functools
+import hashlib
+import logging
+import time
+from collections import ChainMap, OrderedDict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Callable, Deque, Tuple, Union
+from .models import ExtractedData, ValidationRecord, ValidationResult
+from .validators import CLEAN_RESULT, DataValidator
+from .config import CONFIG
+from .json_utils import dumps, loads
+from .reporter import ReportGenerator
+from .retry_handler import RetryHandler
+from .batch_checkpoint import BatchCheckpoint, item_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of memoized AI validation responses per agent
+AI_CACHE_SIZE = 512
+# Seconds a memoized AI validation response stays fresh
+AI_CACHE_TTL = 1800
+# Maximum number of memoized rule-based validation results per agent
+RULE_CACHE_SIZE = 128
+# Length in seconds of the sliding window that CONFIG.AI_RPM_LIMIT applies to
+AI_RATE_WINDOW = 60.0
+
+_AI_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert at validating software development data. Always respond with valid JSON."
+}
+
+_AI_PROMPT_TEMPLATE = (
+    "Validate this extracted software repository data.\n"
+    "Repository Owner: {repo_owner}\n"
+    "Date: {date}\n"
+    "Version Change: {version_change}\n"
+    "Description: {description}\n"
+    "Check for: logical inconsistencies; unrealistic or suspicious values; "
+    "missing critical information; data quality issues.\n"
+    'Reply with JSON only: {{"is_valid": bool, "errors": [str], "warnings": [str]}}'
+)
+
+_AI_BATCH_PROMPT_TEMPLATE = (
+    "Validate each item in this JSON array of extracted software repository data.\n"
+    "Items: {items}\n"
+    "For each item check for: logical inconsistencies; unrealistic or suspicious values; "
+    "missing critical information; data quality issues.\n"
+    'Reply with JSON only: {{"results": [{{"is_valid": bool, "errors": [str], "warnings": [str]}}]}} '
+    "where results[i] is the verdict for item i."
+)
+
+# Upper bound on the AI verdict length; the JSON reply is short
+AI_MAX_TOKENS = 120
+
+# DataValidator is stateless, so every agent can share one instance
+_SHARED_VALIDATOR = DataValidator()
+
+
+@functools.cache
+def _get_openai_client(api_key: str):
+    """Return an OpenAI client shared by all agents using the same API key."""
+    # Only pay the openai import cost when AI validation is enabled
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
+
+@functools.cache
+def _shared_report_generator() -> ReportGenerator:
+    """Return the process-wide ReportGenerator, creating it on first use."""
+    return ReportGenerator()
+
+
+class ObserverAgent:
+    """Agent that observes and validates data extraction from the extractor agent."""
+
+    def __init__(
+        self,
+        strict_mode: bool = None,
+        use_ai: bool = False,
+        generate_reports: bool = True,
+        max_retries: int = 2,
+        max_concurrency: Optional[int] = None,
+        history_size: Optional[int] = 10_000
+    ):
+        """
+        Initialize the observer agent.
+
+        Args:
+            strict_mode: If True, raises exceptions on validation failures.
+                         If None, uses CONFIG.STRICT_MODE.
+            use_ai: If True, uses AI for additional validation checks.
+            generate_reports: If True, generates reports when validation fails.
+            max_retries: Maximum number of retry attempts for extractor (default: 2).
+            max_concurrency: Maximum number of in-flight AI requests during batch
+                             observation. If None, uses CONFIG.AI_MAX_CONCURRENT.
+            history_size: Number of most recent validations kept in
+                          validation_history (and covered by the summary and
+                          failed-validation list), at least 1. None keeps all
+                          of them.
+        """
+        if history_size is not None and history_size < 1:
+            raise ValueError(f"history_size must be at least 1 (or None), got {history_size}")
+        self.strict_mode = strict_mode if strict_mode is not None else CONFIG.STRICT_MODE
+        self.use_ai = use_ai and CONFIG.ENABLE_AI_VALIDATION
+        self.generate_reports = generate_reports
+        # FIX 7: Removed redundant None guard — type hint guarantees int
+        self.max_retries = max_retries
+        self.max_concurrency = max_concurrency or CONFIG.AI_MAX_CONCURRENT
+        self.validator = _SHARED_VALIDATOR
+        # Bounded, so a long-running observer does not grow without limit
+        self.validation_history: Deque[ValidationRecord] = deque(maxlen=history_size)
+        # Running totals over validation_history, so get_validation_summary is O(1)
+        self._passed = 0
+        self._total_errors = 0
+        self._total_warnings = 0
+        # The failed records of validation_history, oldest first
+        self._failed: Deque[ValidationRecord] = deque()
+        self._retry_handler: Optional[RetryHandler] = None  # Built on first retry
+        self._client = None  # Resolved on the first AI request
+        # Created lazily by observe_batch_async; its connection pool belongs
+        # to the event loop it was created in
+        self._async_client = None
+        self._async_client_loop = None
+        # LRU memo of AI responses keyed on a hash of the request contents,
+        # storing (response, time cached)
+        self._ai_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._ai_cache_hits = 0
+        self._ai_cache_misses = 0
+        # LRU memo of rule-based results keyed on the validated fields; retries
+        # and repeated items often resubmit identical data
+        self._rule_cache: "OrderedDict[Tuple[Any, ...], ValidationResult]" = OrderedDict()
+        # Send times of AI requests within the last AI_RATE_WINDOW seconds
+        self._ai_request_times: Deque[float] = deque()
+
+        if self.use_ai:
+            if not CONFIG.OPENAI_API_KEY:
+                raise ValueError("OPENAI_API_KEY is required for AI validation. Set it in .env file.")
+            self.model = CONFIG.OPENAI_VALIDATOR_MODEL
+            self.temperature = CONFIG.OPENAI_TEMPERATURE
+
+    @property
+    def retry_handler(self) -> RetryHandler:
+        """Retry handler for this agent, created on first use."""
+        if self._retry_handler is None:
+            self._retry_handler = RetryHandler(max_retries=self.max_retries)
+        return self._retry_handler
+
+    @property
+    def report_generator(self) -> Optional[ReportGenerator]:
+        """Shared report generator (created on first report), or None when reports are disabled."""
+        if not self.generate_reports:
+            return None
+        return _shared_report_generator()
+
+    @property
+    def client(self):
+        """OpenAI client shared across agents, resolved on the first AI request."""
+        if self._client is None:
+            self._client = _get_openai_client(CONFIG.OPENAI_API_KEY)
+        return self._client
+
+    @property
+    def async_client(self):
+        """This agent's AsyncOpenAI client for the running event loop, created on first use in it."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=CONFIG.OPENAI_API_KEY)
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def _close_async_client(self):
+        """Close the async client (and its connections) before its event loop ends."""
+        if self._async_client is not None:
+            client, self._async_client, self._async_client_loop = self._async_client, None, None
+            await client.close()
+
+    async def _observe_batch_in_own_loop(self, *args, **kwargs) -> List[ValidationResult]:
+        """observe_batch_async for an event loop of its own, closing the async client at the end."""
+        try:
+            return await self.observe_batch_async(*args, **kwargs)
+        finally:
+            await self._close_async_client()
+
+    # ------------------------------------------------------------------
+    # FIX 1: Extracted shared validation logic into one private method
+    # ------------------------------------------------------------------
+    def _run_validation_core(self, extracted_data: ExtractedData) -> ValidationResult:
+        """
+        Core validation pipeline shared by all observe methods.
+        Runs the completeness pre-filter, full validation, and optional AI validation.
+
+        Args:
+            extracted_data: The extracted data to validate.
+
+        Returns:
+            Combined ValidationResult.
+        """
+        # Missing required fields fail fast: no full validation, no AI call
+        rejected = self._quick_reject(extracted_data)
+        if rejected is not None:
+            return rejected
+
+        # FIX 5: AI validation runs regardless of the remaining rule-based
+        # result, so it can contribute additional error context on failures too.
+        ai_result = self._ai_validate(extracted_data) if self.use_ai else None
+        return self._combine_validation(extracted_data, ai_result)
+
+    def _quick_reject(self, extracted_data: ExtractedData) -> Optional[ValidationResult]:
+        """
+        Cheap pre-filter on the required fields.
+
+        Args:
+            extracted_data: The extracted data to validate.
+
+        Returns:
+            A failed ValidationResult if repo_owner, date or description is
+            missing or blank, otherwise None.
+        """
+        repo_owner = extracted_data.repo_owner
+        description = extracted_data.description
+        if (
+            repo_owner and not repo_owner.isspace()
+            and extracted_data.date
+            and description and not description.isspace()
+        ):
+            return None
+        return self.validator.validate_completeness(extracted_data)
+
+    def _combine_validation(
+        self,
+        extracted_data: ExtractedData,
+        ai_result: Optional[Dict[str, Any]],
+        now: Optional[datetime] = None,
+        validation_result: Optional[ValidationResult] = None
+    ) -> ValidationResult:
+        """
+        Run the rule-based checks and merge in an (optional) AI result.
+
+        Only called for data that passed _quick_reject, which already enforces
+        everything validate_completeness checks, so a single
+        validate_extracted_data pass over the fields is enough.
+
+        Args:
+            extracted_data: The extracted data to validate.
+            ai_result: Parsed AI validation response, or None if not available.
+            now: Reference time for the date checks (see validate_extracted_data).
+            validation_result: Rule-based result already computed for this item
+                               (e.g. by validate_batch); computed here if None.
+
+        Returns:
+            Combined ValidationResult.
+        """
+        if validation_result is None:
+            validation_result = self._rule_validate(extracted_data, now)
+
+        # Happy path: nothing to merge, so hand back the shared sentinel
+        if not ai_result and validation_result.is_valid and not validation_result.warnings:
+            return CLEAN_RESULT
+
+        if not ai_result:
+            return validation_result
+
+        # Merged into a new result; the rule-based one may be shared (cached)
+        all_errors = validation_result.errors
+        all_warnings = (*validation_result.warnings, *ai_result.get("warnings", []))
+        is_valid = validation_result.is_valid
+
+        if not ai_result.get("is_valid", True):
+            all_errors = (*all_errors, *ai_result.get("errors", []))
+            is_valid = False
+
+        return ValidationResult(
+            is_valid=is_valid,
+            errors=all_errors,
+            warnings=all_warnings
+        )
+
+    def observe_extraction(
+        self,
+        extracted_data: ExtractedData,
+        source_context: Optional[Dict[str, Any]] = None,
+        _generate_report: bool = True
+    ) -> ValidationResult:
+        """
+        Observe and validate extracted data from the extractor agent.
+
+        Main check: No data extracted can be empty or invalid.
+
+        Args:
+            extracted_data: The extracted data to validate.
+            source_context: Optional context about the source.
+            _generate_report: Internal flag — set to False during retries to
+                              suppress premature report generation.
+
+        Returns:
+            ValidationResult with validation status.
+
+        Raises:
+            ValueError: If strict_mode is True and validation fails.
+        """
+        # FIX 1: Use shared validation pipeline
+        combined_result = self._run_validation_core(extracted_data)
+        return self._finalize_observation(
+            extracted_data, combined_result, source_context, _generate_report
+        )
+
+    def _finalize_observation(
+        self,
+        extracted_data: ExtractedData,
+        combined_result: ValidationResult,
+        source_context: Optional[Dict[str, Any]],
+        _generate_report: bool = True
+    ) -> ValidationResult:
+        """
+        Record, then raise (strict mode) or report on a finished validation.
+
+        Args:
+            extracted_data: The extracted data that was validated.
+            combined_result: The combined validation result.
+            source_context: Optional context about the source.
+            _generate_report: Whether a failure report may be generated.
+
+        Returns:
+            The combined ValidationResult.
+
+        Raises:
+            ValueError: If strict_mode is True and validation fails.
+        """
+        # Record every call in history (FIX 3: retries now also record via this path)
+        self._record_validation(extracted_data, combined_result, source_context)
+
+        # Strict mode raises before any report I/O; the exception carries the
+        # errors and nothing would ever receive the report path
+        self._maybe_raise(combined_result)
+
+        # FIX 2: Report generation is now controlled by the _generate_report flag,
+        # not a fragile retry_count injected into source_context by the caller.
+        # Reports are suppressed during retries and only emitted when truly final.
+        if _generate_report:
+            report_path = self._maybe_report(extracted_data, combined_result, source_context)
+            if report_path:
+                logger.info("Report generated: %s", report_path)
+
+        return combined_result
+
+    def _maybe_report(
+        self,
+        extracted_data: ExtractedData,
+        result: ValidationResult,
+        source_context: Optional[Dict[str, Any]]
+    ) -> Optional[str]:
+        """Generate a failure report if validation failed and reports are enabled."""
+        if result.is_valid or not self.generate_reports or not self.report_generator:
+            return None
+        return self.report_generator.generate_report(
+            extracted_data=extracted_data,
+            validation_result=result,
+            source_context=source_context,
+            format="text"
+        )
+
+    def _maybe_raise(self, result: ValidationResult):
+        """Raise ValueError for a failed validation when in strict mode."""
+        if self.strict_mode and not result.is_valid:
+            error_msg = f"Validation failed: {', '.join(result.errors)}"
+            raise ValueError(error_msg)
+
+    def _rule_validate(self, extracted_data: ExtractedData, now: Optional[datetime] = None) -> ValidationResult:
+        """
+        Rule-based validation, memoized on the validated fields.
+
+        Args:
+            extracted_data: The extracted data to validate.
+            now: Reference time for the date checks. Defaults to datetime.now().
+
+        Returns:
+            The (possibly shared) rule-based ValidationResult.
+        """
+        key = (
+            extracted_data.repo_owner,
+            extracted_data.date,
+            extracted_data.version_change,
+            extracted_data.description
+        )
+        result = self._rule_cache.get(key)
+        if result is not None:
+            self._rule_cache.move_to_end(key)
+            return result
+
+        if now is None:
+            now = datetime.now()
+        result = self.validator.validate_extracted_data(extracted_data, now)
+        # A future date's warning goes stale once the date passes, so only
+        # results for past dates are kept
+        if extracted_data.date <= now:
+            self._rule_cache[key] = result
+            if len(self._rule_cache) > RULE_CACHE_SIZE:
+                self._rule_cache.popitem(last=False)
+        return result
+
+    def _build_ai_messages(self, extracted_data: ExtractedData) -> List[Dict[str, str]]:
+        """Build the chat messages for an AI validation request."""
+        prompt = _AI_PROMPT_TEMPLATE.format_map({
+            "repo_owner": extracted_data.repo_owner,
+            "date": extracted_data.date.isoformat(),
+            "version_change": extracted_data.version_change or 'Not specified',
+            "description": extracted_data.description
+        })
+        return [_AI_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+
+    def _ai_cache_key(self, extracted_data: ExtractedData) -> bytes:
+        """Hash identifying an AI validation request by its data and model settings."""
+        parts = (
+            extracted_data.repo_owner,
+            extracted_data.date.isoformat(),
+            extracted_data.version_change or "",
+            extracted_data.description,
+            self.model,
+            str(self.temperature)
+        )
+        return hashlib.sha256("\x00".join(parts).encode("utf-8")).digest()
+
+    def _ai_cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a fresh memoized AI response, marking it most recently used."""
+        entry = self._ai_cache.get(key)
+        if entry is not None:
+            result, cached_at = entry
+            if time.monotonic() - cached_at < AI_CACHE_TTL:
+                self._ai_cache.move_to_end(key)
+                self._ai_cache_hits += 1
+                return result
+            del self._ai_cache[key]
+        self._ai_cache_misses += 1
+        return None
+
+    def _ai_cache_put(self, key: bytes, result: Dict[str, Any]):
+        """Memoize an AI response, evicting the least recently used entry."""
+        self._ai_cache[key] = (result, time.monotonic())
+        self._ai_cache.move_to_end(key)
+        if len(self._ai_cache) > AI_CACHE_SIZE:
+            self._ai_cache.popitem(last=False)
+
+    def _rate_window_delay(self) -> float:
+        """
+        Reserve a slot for one AI request in the sliding rate window.
+
+        Returns:
+            0.0 if the request may be sent now (the slot is taken), otherwise
+            the number of seconds until the oldest request leaves the window.
+        """
+        limit = CONFIG.AI_RPM_LIMIT
+        if limit <= 0:
+            return 0.0
+
+        now = time.monotonic()
+        request_times = self._ai_request_times
+        while request_times and now - request_times[0] >= AI_RATE_WINDOW:
+            request_times.popleft()
+
+        if len(request_times) >= limit:
+            return AI_RATE_WINDOW - (now - request_times[0])
+
+        request_times.append(now)
+        return 0.0
+
+    def _wait_for_rate_window(self):
+        """Block until an AI request fits under CONFIG.AI_RPM_LIMIT."""
+        while (delay := self._rate_window_delay()) > 0:
+            time.sleep(delay)
+
+    async def _wait_for_rate_window_async(self):
+        """Async counterpart of _wait_for_rate_window; yields to the event loop while throttled."""
+        while (delay := self._rate_window_delay()) > 0:
+            await asyncio.sleep(delay)
+
+    def _ai_validate(self, extracted_data: ExtractedData) -> Optional[Dict[str, Any]]:
+        """
+        Use AI to perform additional validation checks.
+
+        Identical extractions (e.g. repeated during retries) are answered from
+        an in-memory cache instead of issuing another request.
+
+        Args:
+            extracted_data: The extracted data to validate.
+
+        Returns:
+            Dictionary with AI validation results or None.
+        """
+        key = self._ai_cache_key(extracted_data)
+        cached = self._ai_cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = self._request_ai_validation(extracted_data)
+        if result is not None:
+            self._ai_cache_put(key, result)
+        return result
+
+    def _request_ai_validation(self, extracted_data: ExtractedData) -> Optional[Dict[str, Any]]:
+        """Send one single-item AI request, bypassing the cache."""
+        self._wait_for_rate_window()
+        try:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_ai_messages(extracted_data),
+                temperature=self.temperature,
+                max_tokens=AI_MAX_TOKENS,
+                response_format={"type": "json_object"}
+            )
+            return loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.warning("AI validation failed: %s", e)
+            return None
+
+    async def _ai_validate_async(self, extracted_data: ExtractedData) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of _ai_validate using the AsyncOpenAI client.
+
+        Args:
+            extracted_data: The extracted data to validate.
+
+        Returns:
+            Dictionary with AI validation results or None.
+        """
+        key = self._ai_cache_key(extracted_data)
+        cached = self._ai_cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = await self._request_ai_validation_async(extracted_data)
+        if result is not None:
+            self._ai_cache_put(key, result)
+        return result
+
+    async def _request_ai_validation_async(self, extracted_data: ExtractedData) -> Optional[Dict[str, Any]]:
+        """Async counterpart of _request_ai_validation."""
+        await self._wait_for_rate_window_async()
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=self._build_ai_messages(extracted_data),
+                temperature=self.temperature,
+                max_tokens=AI_MAX_TOKENS,
+                response_format={"type": "json_object"}
+            )
+            return loads(response.choices[0].message.content)
+        except Exception as e:
+            logger.warning("AI validation failed: %s", e)
+            return None
+
+    def _build_ai_batch_messages(self, batch: List[ExtractedData]) -> List[Dict[str, str]]:
+        """Build the chat messages for validating several items in one request."""
+        items = [
+            {
+                "repo_owner": extracted_data.repo_owner,
+                "date": extracted_data.date.isoformat(),
+                "version_change": extracted_data.version_change or 'Not specified',
+                "description": extracted_data.description
+            }
+            for extracted_data in batch
+        ]
+        prompt = _AI_BATCH_PROMPT_TEMPLATE.format_map({"items": dumps(items, indent=False)})
+        return [_AI_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _parse_ai_batch_response(content: str, size: int) -> Optional[List[Dict[str, Any]]]:
+        """Extract the per-item results, or None if the reply does not line up."""
+        results = loads(content).get("results")
+        if not isinstance(results, list) or len(results) != size:
+            return None
+        return results
+
+    def _ai_validate_batch(self, batch: List[ExtractedData]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Validate several items with one AI request per CONFIG.AI_BATCH_SIZE items.
+
+        Cached items are answered locally. If a batched reply cannot be used,
+        the affected items fall back to one single-item request each.
+
+        Args:
+            batch: The extracted data to validate.
+
+        Returns:
+            AI validation result (or None) for each item, in input order.
+        """
+        keys = [self._ai_cache_key(extracted_data) for extracted_data in batch]
+        results = [self._ai_cache_get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        batch_size = CONFIG.AI_BATCH_SIZE
+
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            chunk_results = None
+            if len(chunk) > 1:
+                self._wait_for_rate_window()
+                try:
+                    response = self.client.chat.completions.create(
+                        model=self.model,
+                        messages=self._build_ai_batch_messages([batch[i] for i in chunk]),
+                        temperature=self.temperature,
+                        max_tokens=AI_MAX_TOKENS * len(chunk),
+                        response_format={"type": "json_object"}
+                    )
+                    chunk_results = self._parse_ai_batch_response(response.choices[0].message.content, len(chunk))
+                except Exception as e:
+                    logger.warning("Batched AI validation failed: %s. Validating items individually.", e)
+
+            if chunk_results is None:
+                chunk_results = [self._request_ai_validation(batch[i]) for i in chunk]
+
+            for i, result in zip(chunk, chunk_results):
+                results[i] = result
+                if result is not None:
+                    self._ai_cache_put(keys[i], result)
+
+        return results
+
+    async def _ai_validate_batch_async(self, batch: List[ExtractedData]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Async counterpart of _ai_validate_batch for a single chunk of items.
+
+        Args:
+            batch: The extracted data to validate (at most CONFIG.AI_BATCH_SIZE items).
+
+        Returns:
+            AI validation result (or None) for each item, in input order.
+        """
+        keys = [self._ai_cache_key(extracted_data) for extracted_data in batch]
+        results = [self._ai_cache_get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        pending_results = None
+        if len(pending) > 1:
+            await self._wait_for_rate_window_async()
+            try:
+                response = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=self._build_ai_batch_messages([batch[i] for i in pending]),
+                    temperature=self.temperature,
+                    max_tokens=AI_MAX_TOKENS * len(pending),
+                    response_format={"type": "json_object"}
+                )
+                pending_results = self._parse_ai_batch_response(response.choices[0].message.content, len(pending))
+            except Exception as e:
+                logger.warning("Batched AI validation failed: %s. Validating items individually.", e)
+
+        if pending_results is None:
+            pending_results = [await self._request_ai_validation_async(batch[i]) for i in pending]
+
+        for i, result in zip(pending, pending_results):
+            results[i] = result
+            if result is not None:
+                self._ai_cache_put(keys[i], result)
+
+        return results
+
+    def _record_validation(
+        self,
+        extracted_data: ExtractedData,
+        result: ValidationResult,
+        source_context: Optional[Dict[str, Any]]
+    ):
+        """Record validation result in history."""
+        history = self.validation_history
+        if history and len(history) == history.maxlen:
+            # The append below evicts the oldest record; take it out of the totals
+            oldest = history[0]
+            self._passed -= oldest.is_valid
+            self._total_errors -= len(oldest.errors)
+            self._total_warnings -= len(oldest.warnings)
+            if not oldest.is_valid:
+                self._failed.popleft()
+
+        self._passed += result.is_valid
+        self._total_errors += len(result.errors)
+        self._total_warnings += len(result.warnings)
+        record = ValidationRecord(
+            # Stored as an int; only converted to a datetime when history is read
+            timestamp_ns=time.time_ns(),
+            repo_owner=extracted_data.repo_owner,
+            date=extracted_data.date,
+            version_change=extracted_data.version_change,
+            is_valid=result.is_valid,
+            errors=result.errors,
+            warnings=result.warnings,
+            source_context=source_context
+        )
+        history.append(record)
+        if not record.is_valid:
+            self._failed.append(record)
+
+    def get_validation_summary(self) -> Dict[str, Any]:
+        """
+        Get summary of all validations performed.
+
+        Returns:
+            Dictionary with validation statistics.
+        """
+        if not self.validation_history:
+            summary = {
+                "total_validations": 0,
+                "passed": 0,
+                "failed": 0,
+                "total_errors": 0,
+                "total_warnings": 0
+            }
+            self._add_ai_cache_stats(summary)
+            return summary
+
+        total = len(self.validation_history)
+        passed = self._passed
+        failed = total - passed
+        total_errors = self._total_errors
+        total_warnings = self._total_warnings
+
+        summary = {
+            "total_validations": total,
+            "passed": passed,
+            "failed": failed,
+            "pass_rate": (passed / total * 100) if total > 0 else 0,
+            "total_errors": total_errors,
+            "total_warnings": total_warnings,
+            "average_errors_per_validation": total_errors / total if total > 0 else 0,
+            "average_warnings_per_validation": total_warnings / total if total > 0 else 0
+        }
+        self._add_ai_cache_stats(summary)
+        return summary
+
+    def _add_ai_cache_stats(self, summary: Dict[str, Any]):
+        """Add AI response cache counters to a summary when AI validation is on."""
+        if self.use_ai:
+            summary["ai_cache_hits"] = self._ai_cache_hits
+            summary["ai_cache_misses"] = self._ai_cache_misses
+
+    def get_failed_validations(self) -> List[Dict[str, Any]]:
+        """
+        Get list of failed validations still held in validation_history.
+
+        Returns:
+            List of validation records that failed.
+        """
+        return [record.to_dict() for record in self._failed]
+
+    def observe_with_retry(
+        self,
+        extractor_func: Callable,
+        extractor_args: Dict[str, Any],
+        source_context: Optional[Dict[str, Any]] = None
+    ) -> Tuple[ExtractedData, ValidationResult, int]:
+        """
+        Observe extraction with automatic retry if validation fails.
+
+        Each attempt is validated without report generation.
+        A final report is only generated after all retries are exhausted.
+
+        Args:
+            extractor_func: The extractor function to call.
+            extractor_args: Arguments to pass to the extractor function.
+            source_context: Optional context about the source.
+
+        Returns:
+            Tuple of (extracted_data, validation_result, retry_count).
+        """
+        # FIX 3 & 6: Removed dead `validate_data` closure.
+        # _validate_for_retry shares the validation core with observe_extraction(),
+        # suppressing reports during retry attempts and recording history properly.
+
+        extracted_data, validation_result, retry_count = self.retry_handler.execute_with_retry(
+            extractor_func=extractor_func,
+            extractor_args=extractor_args,
+            validation_func=self._validate_for_retry,
+            context=source_context
+        )
+
+        # Generate final report only after all retries exhausted
+        if not validation_result.is_valid:
+            # Overlay the retry details without copying the caller's context;
+            # report writers only read from it
+            retry_context = ChainMap(
+                {
+                    'retry_count': retry_count,
+                    'max_retries': self.max_retries,
+                    'retry_exhausted': True
+                },
+                source_context or {}
+            )
+
+            report_path = self._maybe_report(extracted_data, validation_result, retry_context)
+            if report_path:
+                logger.warning("All %d retry attempts exhausted. Report generated: %s", retry_count, report_path)
+
+        return extracted_data, validation_result, retry_count
+
+    def _validate_for_retry(self, extracted_data: ExtractedData) -> ValidationResult:
+        """
+        Validation method used during retry cycles.
+
+        FIX 1 & 3: Shares the validation core with observe_extraction() and
+        records history on every attempt, but never generates a report; that
+        happens once in observe_with_retry() after retries are exhausted.
+
+        Args:
+            extracted_data: The extracted data to validate.
+
+        Returns:
+            ValidationResult.
+        """
+        result = self._run_validation_core(extracted_data)
+        self._record_validation(extracted_data, result, None)
+        self._maybe_raise(result)
+        return result
+
+    def generate_summary_report(self, format: str = "text") -> Optional[str]:
+        """
+        Generate a summary report of all failed validations.
+
+        Args:
+            format: Report format ('text', 'json', 'html').
+
+        Returns:
+            Path to the generated report file, or None if no failures.
+        """
+        if not self.generate_reports or not self.report_generator:
+            return None
+
+        # The summary comes from running totals, so a clean history is
+        # recognised without scanning it for failures
+        summary_stats = self.get_validation_summary()
+        if not summary_stats["failed"]:
+            return None
+
+        failed_validations = self.get_failed_validations()
+        return self.report_generator.generate_summary_report(
+            failed_validations=failed_validations,
+            summary_stats=summary_stats,
+            format=format
+        )
+
+    def clear_history(self):
+        """Clear validation history."""
+        self.validation_history.clear()
+        self._failed.clear()
+        self._passed = 0
+        self._total_errors = 0
+        self._total_warnings = 0
+
+    def observe_batch(
+        self,
+        extracted_data_list: List[ExtractedData],
+        source_contexts: Optional[List[Dict[str, Any]]] = None,
+        strict_mode_override: Optional[bool] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None
+    ) -> List[ValidationResult]:
+        """
+        Observe and validate multiple extractions in batch.
+
+        FIX 4: Added strict_mode_override parameter so callers can explicitly
+        control strict mode behaviour in batch context rather than having it
+        silently ignored.
+
+        When AI validation is enabled and no event loop is running, the batch is
+        delegated to observe_batch_async so AI requests run concurrently.
+
+        Args:
+            extracted_data_list: List of extracted data to validate.
+            source_contexts: Optional list of source contexts (one per extraction).
+            strict_mode_override: If provided, overrides instance strict_mode for
+                                  this batch. Pass False to suppress exceptions in
+                                  batch; pass True to enforce them.
+            checkpoint_path: Optional JSONL file recording each finished item.
+                             Items already recorded there are not validated
+                             again, so an interrupted batch can be resumed.
+
+        Returns:
+            List of ValidationResult objects.
+        """
+        if self.use_ai and not self._in_event_loop():
+            return asyncio.run(self._observe_batch_in_own_loop(
+                extracted_data_list,
+                source_contexts=source_contexts,
+                strict_mode_override=strict_mode_override,
+                checkpoint_path=checkpoint_path
+            ))
+
+        checkpoint = None
+        if checkpoint_path is not None:
+            checkpoint = BatchCheckpoint(checkpoint_path, [item_fingerprint(d) for d in extracted_data_list])
+            extracted_data_list, source_contexts = self._pending_items(
+                checkpoint, extracted_data_list, source_contexts
+            )
+
+        # Items missing required fields never reach AI validation
+        rejected = [self._quick_reject(extracted_data) for extracted_data in extracted_data_list]
+        ai_results: List[Optional[Dict[str, Any]]] = [None] * len(extracted_data_list)
+
+        if self.use_ai:
+            candidates = [i for i, result in enumerate(rejected) if result is None]
+            candidate_results = self._ai_validate_batch([extracted_data_list[i] for i in candidates])
+            for i, ai_result in zip(candidates, candidate_results):
+                ai_results[i] = ai_result
+
+        return self._finalize_batch(
+            extracted_data_list, source_contexts, rejected, ai_results, strict_mode_override, checkpoint
+        )
+
+    @staticmethod
+    def _in_event_loop() -> bool:
+        """Return True if called from within a running asyncio event loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    async def observe_batch_async(
+        self,
+        extracted_data_list: List[ExtractedData],
+        source_contexts: Optional[List[Dict[str, Any]]] = None,
+        strict_mode_override: Optional[bool] = None,
+        max_concurrency: Optional[int] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None
+    ) -> List[ValidationResult]:
+        """
+        Async variant of observe_batch that runs AI validation calls concurrently.
+
+        Rule-based checks, history recording and report generation still run
+        in input order; only the network-bound AI requests are fanned out.
+        Items are sent CONFIG.AI_BATCH_SIZE at a time per request, with the
+        number of in-flight requests bounded by a semaphore.
+
+        Args:
+            extracted_data_list: List of extracted data to validate.
+            source_contexts: Optional list of source contexts (one per extraction).
+            strict_mode_override: Same semantics as in observe_batch.
+            max_concurrency: Maximum number of in-flight AI requests.
+                             If None, uses the agent's max_concurrency.
+            checkpoint_path: Same semantics as in observe_batch.
+
+        Returns:
+            List of ValidationResult objects.
+        """
+        checkpoint = None
+        if checkpoint_path is not None:
+            checkpoint = BatchCheckpoint(checkpoint_path, [item_fingerprint(d) for d in extracted_data_list])
+            extracted_data_list, source_contexts = self._pending_items(
+                checkpoint, extracted_data_list, source_contexts
+            )
+
+        # Items missing required fields never reach the AI fan-out
+        rejected = [self._quick_reject(extracted_data) for extracted_data in extracted_data_list]
+        ai_results: List[Optional[Dict[str, Any]]] = [None] * len(extracted_data_list)
+
+        if self.use_ai:
+            semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+            candidates = [i for i, result in enumerate(rejected) if result is None]
+            batch_size = CONFIG.AI_BATCH_SIZE
+            chunks = [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
+
+            async def _validate_chunk(chunk: List[int]) -> List[Optional[Dict[str, Any]]]:
+                async with semaphore:
+                    return await self._ai_validate_batch_async([extracted_data_list[i] for i in chunk])
+
+            chunk_results = await asyncio.gather(*(_validate_chunk(chunk) for chunk in chunks))
+            for chunk, results in zip(chunks, chunk_results):
+                for i, ai_result in zip(chunk, results):
+                    ai_results[i] = ai_result
+
+        return self._finalize_batch(
+            extracted_data_list, source_contexts, rejected, ai_results, strict_mode_override, checkpoint
+        )
+
+    @staticmethod
+    def _pending_items(
+        checkpoint: BatchCheckpoint,
+        extracted_data_list: List[ExtractedData],
+        source_contexts: Optional[List[Dict[str, Any]]]
+    ) -> Tuple[List[ExtractedData], Optional[List[Dict[str, Any]]]]:
+        """Narrow a batch (and its contexts) to the items the checkpoint has not finished."""
+        pending = checkpoint.pending
+        if len(pending) < len(extracted_data_list):
+            extracted_data_list = [extracted_data_list[i] for i in pending]
+            if source_contexts is not None:
+                source_contexts = [source_contexts[i] for i in pending]
+        return extracted_data_list, source_contexts
+
+    def _finalize_batch(
+        self,
+        extracted_data_list: List[ExtractedData],
+        source_contexts: Optional[List[Dict[str, Any]]],
+        rejected: List[Optional[ValidationResult]],
+        ai_results: List[Optional[Dict[str, Any]]],
+        strict_mode_override: Optional[bool],
+        checkpoint: Optional[BatchCheckpoint] = None
+    ) -> List[ValidationResult]:
+        """
+        Combine, record and report batch results in input order.
+
+        Args:
+            extracted_data_list: List of extracted data that was validated.
+            source_contexts: Optional list of source contexts (one per extraction).
+            rejected: Quick-reject result per item, or None if it passed.
+            ai_results: AI validation response per item, or None.
+            strict_mode_override: Same semantics as in observe_batch.
+            checkpoint: Optional checkpoint; each finished item is appended to it
+                        and previously recorded results are merged back in.
+
+        Returns:
+            List of ValidationResult objects.
+        """
+        if source_contexts is None:
+            source_contexts = [None] * len(extracted_data_list)
+
+        # Determine effective strict mode for this batch
+        effective_strict = strict_mode_override if strict_mode_override is not None else self.strict_mode
+
+        # Temporarily override strict_mode if needed
+        original_strict = self.strict_mode
+        self.strict_mode = effective_strict
+
+        # One clock read for the whole batch's date checks
+        now = datetime.now()
+        # Rule-based checks for every item that passed quick-reject, in one call
+        rule_results = iter(self.validator.validate_batch(
+            [d for d, rejected_result in zip(extracted_data_list, rejected) if rejected_result is None],
+            now,
+            max_workers=CONFIG.VALIDATION_WORKERS
+        ))
+        results = []
+        try:
+            for extracted_data, context, ai_result, rejected_result in zip(
+                extracted_data_list, source_contexts, ai_results, rejected
+            ):
+                try:
+                    combined_result = rejected_result or self._combine_validation(
+                        extracted_data, ai_result, now, next(rule_results)
+                    )
+                    results.append(self._finalize_observation(extracted_data, combined_result, context))
+                except ValueError as e:
+                    # Only reached if strict_mode is True
+                    failed_result = ValidationResult(
+                        is_valid=False,
+                        errors=(str(e),),
+                        warnings=()
+                    )
+                    results.append(failed_result)
+                    if effective_strict:
+                        # Re-raise immediately if strict mode is explicitly enforced in batch.
+                        # The item is not checkpointed, so a resumed run raises for it again.
+                        raise
+                if checkpoint is not None:
+                    checkpoint.record(checkpoint.pending[len(results) - 1], results[-1])
+        finally:
+            # Always restore original strict_mode
+            self.strict_mode = original_strict
+            if checkpoint is not None:
+                checkpoint.close()
+
+        if checkpoint is not None:
+            return checkpoint.merge(results)
+        return results
@@ -0,0 +1,570 @@
+"""
+Report generator for monitoring condition failures.
+"""
+import itertools
+import os
+import re
+import textwrap
+from html import escape
+from typing import Any, Callable, Dict, List, Optional, TextIO
+from datetime import datetime
+from pathlib import Path
+from .models import ExtractedData, ValidationResult
+from .json_utils import dumps
+
+try:
+    import jinja2
+except ImportError:  # jinja2 is optional; fall back to the f-string writers
+    jinja2 = None
+
+# Keywords that select a recommendation, matched in a single pass per message
+_ERROR_KEYWORDS = re.compile(r"repository owner|repo_owner|date|description|version change|version_change", re.IGNORECASE)
+_WARNING_KEYWORDS = re.compile(r"short|description|owner|format|placeholder", re.IGNORECASE)
+
+# Stylesheets are dedented once at import so the source indentation is not
+# copied into every HTML report
+_FAILURE_REPORT_CSS = textwrap.dedent("""
+            body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+            .container { background-color: white; padding: 20px; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            h1 { color: #d32f2f; border-bottom: 3px solid #d32f2f; padding-bottom: 10px; }
+            h2 { color: #1976d2; margin-top: 20px; }
+            .status { background-color: #ffebee; color: #c62828; padding: 10px; border-radius: 5px; font-weight: bold; }
+            .section { margin: 20px 0; padding: 15px; background-color: #f9f9f9; border-left: 4px solid #1976d2; }
+            .error { color: #d32f2f; margin: 5px 0; }
+            .warning { color: #f57c00; margin: 5px 0; }
+            .data-item { margin: 5px 0; }
+            .recommendations { background-color: #e3f2fd; padding: 15px; border-radius: 5px; }
+            ul { margin: 10px 0; }
+            li { margin: 5px 0; }
+        """)
+
+_SUMMARY_REPORT_CSS = textwrap.dedent("""
+            body { font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }
+            .container { background-color: white; padding: 20px; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            h1 { color: #1976d2; border-bottom: 3px solid #1976d2; padding-bottom: 10px; }
+            h2 { color: #1976d2; margin-top: 20px; }
+            .stats { display: grid; grid-template-columns: repeat(2, 1fr); gap: 10px; margin: 20px 0; }
+            .stat-item { background-color: #e3f2fd; padding: 15px; border-radius: 5px; }
+            .stat-label { font-weight: bold; color: #1976d2; }
+            .stat-value { font-size: 24px; color: #0d47a1; }
+            .failed-item { background-color: #ffebee; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #d32f2f; }
+            .error { color: #d32f2f; }
+        """)
+
+
+def _html_prelude(title: str, css: str) -> str:
+    """Static document head and opening container for an HTML report."""
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        f"<title>{title}</title>\n<style>\n{css}</style>\n</head>\n"
+        "<body>\n<div class='container'>\n"
+    )
+
+
+# Invariant HTML skeletons, built once at import
+_FAILURE_HTML_PRELUDE = _html_prelude("Monitoring Condition Failure Report", _FAILURE_REPORT_CSS)
+_SUMMARY_HTML_PRELUDE = _html_prelude("Monitoring Summary Report", _SUMMARY_REPORT_CSS)
+_HTML_POSTLUDE = "</div>\n</body>\n</html>\n"
+
+_FAILURE_HTML_TEMPLATE_SOURCE = """\
+{{ prelude }}<h1>Monitoring Condition Failure Report</h1>
+<p><strong>Generated:</strong> {{ generated_at.strftime('%Y-%m-%d %H:%M:%S') }}</p>
+<div class='status'>VALIDATION STATUS: FAILED</div>
+<h2>Extracted Data</h2>
+<div class='section'>
+<div class='data-item'><strong>Repository Owner:</strong> {{ data.repo_owner }}</div>
+<div class='data-item'><strong>Date:</strong> {{ data.date }}</div>
+<div class='data-item'><strong>Version Change:</strong> {{ data.version_change or 'Not specified' }}</div>
+<div class='data-item'><strong>Description:</strong> {{ data.description }}</div>
+</div>
+{% if source_context %}
+<h2>Source Context</h2>
+<div class='section'>
+{% for key, value in source_context.items() %}
+<div class='data-item'><strong>{{ key }}:</strong> {{ value }}</div>
+{% endfor %}
+</div>
+{% endif %}
+<h2>Validation Errors</h2>
+<div class='section'>
+{% if result.errors %}
+<ul>
+{% for error in result.errors %}
+<li class='error'>{{ error }}</li>
+{% endfor %}
+</ul>
+{% else %}
+<p>No errors found.</p>
+{% endif %}
+</div>
+{% if result.warnings %}
+<h2>Validation Warnings</h2>
+<div class='section'>
+<ul>
+{% for warning in result.warnings %}
+<li class='warning'>{{ warning }}</li>
+{% endfor %}
+</ul>
+</div>
+{% endif %}
+<h2>Recommendations</h2>
+<div class='recommendations'>
+<ul>
+{% for rec in recommendations %}
+<li>{{ rec }}</li>
+{% endfor %}
+</ul>
+</div>
+{{ postlude }}"""
+
+_SUMMARY_HTML_TEMPLATE_SOURCE = """\
+{{ prelude }}<h1>Monitoring Summary Report</h1>
+<p><strong>Generated:</strong> {{ generated_at.strftime('%Y-%m-%d %H:%M:%S') }}</p>
+<h2>Summary Statistics</h2>
+<div class='stats'>
+<div class='stat-item'><div class='stat-label'>Total Validations</div><div class='stat-value'>{{ stats.get('total_validations', 0) }}</div></div>
+<div class='stat-item'><div class='stat-label'>Passed</div><div class='stat-value'>{{ stats.get('passed', 0) }}</div></div>
+<div class='stat-item'><div class='stat-label'>Failed</div><div class='stat-value'>{{ stats.get('failed', 0) }}</div></div>
+<div class='stat-item'><div class='stat-label'>Pass Rate</div><div class='stat-value'>{{ '%.2f' % stats.get('pass_rate', 0) }}%</div></div>
+</div>
+{% if failed_validations %}
+<h2>Failed Validations</h2>
+{% for validation in failed_validations %}
+<div class='failed-item'>
+<h3>Failure #{{ loop.index }}</h3>
+<p><strong>Timestamp:</strong> {{ validation.get('timestamp', 'N/A') }}</p>
+<p><strong>Repository Owner:</strong> {{ validation.get('repo_owner', 'N/A') }}</p>
+<p><strong>Date:</strong> {{ validation.get('date', 'N/A') }}</p>
+<p><strong>Errors:</strong></p>
+<ul>
+{% for error in validation.get('errors', []) %}
+<li class='error'>{{ error }}</li>
+{% endfor %}
+</ul>
+</div>
+{% endfor %}
+{% endif %}
+{{ postlude }}"""
+
+if jinja2 is not None:
+    from markupsafe import Markup
+
+    # Compiled once at import. Values are autoescaped; the static skeleton is
+    # marked safe so it is emitted as-is.
+    _JINJA_ENV = jinja2.Environment(
+        autoescape=True, trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True
+    )
+    _FAILURE_HTML_TEMPLATE = _JINJA_ENV.from_string(
+        _FAILURE_HTML_TEMPLATE_SOURCE,
+        globals={"prelude": Markup(_FAILURE_HTML_PRELUDE), "postlude": Markup(_HTML_POSTLUDE)}
+    )
+    _SUMMARY_HTML_TEMPLATE = _JINJA_ENV.from_string(
+        _SUMMARY_HTML_TEMPLATE_SOURCE,
+        globals={"prelude": Markup(_SUMMARY_HTML_PRELUDE), "postlude": Markup(_HTML_POSTLUDE)}
+    )
+else:
+    _FAILURE_HTML_TEMPLATE = None
+    _SUMMARY_HTML_TEMPLATE = None
+
+# Horizontal rules framing the sections of text reports
+_HEAVY_RULE = "=" * 80 + "\n"
+_LIGHT_RULE = "-" * 80 + "\n"
+
+# Buffer size for report files, large enough that a typical report is one write
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+class ReportGenerator:
+    """Generator for validation failure reports."""
+    
+    def __init__(self, reports_dir: str = "reports"):
+        """
+        Initialize the report generator.
+        
+        Args:
+            reports_dir: Directory to store generated reports
+        """
+        self.reports_dir = Path(reports_dir)
+        self._dir_ensured = False
+        # Per-generator sequence appended to filenames, so reports generated
+        # within the same second never overwrite each other
+        self._seq = itertools.count(1)
+    
+    def _report_path(self, prefix: str, generated_at: datetime, format: str) -> Path:
+        """Return a unique report path, creating the reports directory on first use."""
+        if not self._dir_ensured:
+            self.reports_dir.mkdir(parents=True, exist_ok=True)
+            self._dir_ensured = True
+        return self.reports_dir / f"{prefix}_{generated_at:%Y%m%d_%H%M%S}_{next(self._seq)}.{format}"
+    
+    @staticmethod
+    def _write_atomically(filepath: Path, writer: Callable[..., None], *args: Any) -> None:
+        """
+        Stream a report to a temporary file, then rename it into place.
+        
+        Readers of the reports directory never see a partially written report.
+        
+        Args:
+            filepath: Final path of the report
+            writer: Function writing the report body to the open file
+            *args: Extra arguments passed to ``writer`` after the file
+        """
+        tmp_path = filepath.with_name(f"{filepath.name}.tmp")
+        try:
+            # Stream straight to disk rather than materializing the whole report first
+            with open(tmp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                writer(f, *args)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def generate_report(
+        self,
+        extracted_data: ExtractedData,
+        validation_result: ValidationResult,
+        source_context: Optional[Dict[str, Any]] = None,
+        format: str = "text"
+    ) -> str:
+        """
+        Generate a report when monitoring conditions are not met.
+        
+        Args:
+            extracted_data: The extracted data that failed validation
+            validation_result: The validation result
+            source_context: Optional context about the source
+            format: Report format ('text', 'json', 'html')
+            
+        Returns:
+            Path to the generated report file
+        """
+        if validation_result.is_valid:
+            return None  # No report needed if validation passed
+        
+        # Read the clock once; the filename and the report body share it
+        generated_at = datetime.now()
+        filepath = self._report_path("validation_failure", generated_at, format)
+        
+        writers = {
+            "text": self._write_text_report,
+            "json": self._write_json_report,
+            "html": self._write_html_report
+        }
+        if format not in writers:
+            raise ValueError(f"Unsupported report format: {format}")
+        
+        self._write_atomically(
+            filepath, writers[format], extracted_data, validation_result, source_context, generated_at
+        )
+        
+        return str(filepath)
+    
+    def _write_text_report(
+        self,
+        out: TextIO,
+        extracted_data: ExtractedData,
+        validation_result: ValidationResult,
+        source_context: Optional[Dict[str, Any]],
+        generated_at: datetime
+    ) -> None:
+        """Write a text format report to ``out``."""
+        write = out.write
+        write(f"{_HEAVY_RULE}MONITORING CONDITION FAILURE REPORT\n{_HEAVY_RULE}")
+        write(f"Generated: {generated_at:%Y-%m-%d %H:%M:%S}\n")
+        write("\n")
+        
+        write("VALIDATION STATUS: FAILED\n")
+        write("\n")
+        
+        write(f"{_LIGHT_RULE}EXTRACTED DATA\n{_LIGHT_RULE}")
+        write(f"Repository Owner: {extracted_data.repo_owner}\n")
+        write(f"Date: {extracted_data.date}\n")
+        write(f"Version Change: {extracted_data.version_change or 'Not specified'}\n")
+        write(f"Description: {extracted_data.description}\n")
+        write("\n")
+        
+        if source_context:
+            write(f"{_LIGHT_RULE}SOURCE CONTEXT\n{_LIGHT_RULE}")
+            for key, value in source_context.items():
+                write(f"{key}: {value}\n")
+            write("\n")
+        
+        write(f"{_LIGHT_RULE}VALIDATION ERRORS\n{_LIGHT_RULE}")
+        if validation_result.errors:
+            for i, error in enumerate(validation_result.errors, 1):
+                write(f"{i}. {error}\n")
+        else:
+            write("No errors found.\n")
+        write("\n")
+        
+        if validation_result.warnings:
+            write(f"{_LIGHT_RULE}VALIDATION WARNINGS\n{_LIGHT_RULE}")
+            for i, warning in enumerate(validation_result.warnings, 1):
+                write(f"{i}. {warning}\n")
+            write("\n")
+        
+        write(f"{_LIGHT_RULE}RECOMMENDATIONS\n{_LIGHT_RULE}")
+        for rec in self._generate_recommendations_list(validation_result):
+            write(f"- {rec}\n")
+        write("\n")
+        
+        write(f"{_HEAVY_RULE}END OF REPORT\n{_HEAVY_RULE}")
+    
+    def _write_json_report(
+        self,
+        out: TextIO,
+        extracted_data: ExtractedData,
+        validation_result: ValidationResult,
+        source_context: Optional[Dict[str, Any]],
+        generated_at: datetime
+    ) -> None:
+        """Write a JSON format report to ``out``."""
+        report_data = {
+            "report_type": "monitoring_condition_failure",
+            "generated_at": generated_at.isoformat(),
+            "validation_status": "failed",
+            "extracted_data": {
+                "repo_owner": extracted_data.repo_owner,
+                "date": extracted_data.date.isoformat(),
+                "version_change": extracted_data.version_change,
+                "description": extracted_data.description
+            },
+            "source_context": source_context or {},
+            "validation_result": {
+                "is_valid": validation_result.is_valid,
+                "errors": validation_result.errors,
+                "warnings": validation_result.warnings
+            },
+            "recommendations": self._generate_recommendations_list(validation_result)
+        }
+        
+        out.write(dumps(report_data))
+    
+    def _write_html_report(
+        self,
+        out: TextIO,
+        extracted_data: ExtractedData,
+        validation_result: ValidationResult,
+        source_context: Optional[Dict[str, Any]],
+        generated_at: datetime
+    ) -> None:
+        """Write an HTML format report to ``out``."""
+        if _FAILURE_HTML_TEMPLATE is not None:
+            out.writelines(_FAILURE_HTML_TEMPLATE.generate(
+                generated_at=generated_at,
+                data=extracted_data,
+                source_context=source_context,
+                result=validation_result,
+                recommendations=self._generate_recommendations_list(validation_result)
+            ))
+            return
+        
+        write = out.write
+        # Fixed-shape sections are emitted as one f-string each; only the
+        # variable-length lists are written item by item
+        write(
+            f"{_FAILURE_HTML_PRELUDE}"
+            "<h1>Monitoring Condition Failure Report</h1>\n"
+            f"<p><strong>Generated:</strong> {generated_at:%Y-%m-%d %H:%M:%S}</p>\n"
+            "<div class='status'>VALIDATION STATUS: FAILED</div>\n"
+            "<h2>Extracted Data</h2>\n"
+            "<div class='section'>\n"
+            f"<div class='data-item'><strong>Repository Owner:</strong> {escape(extracted_data.repo_owner)}</div>\n"
+            f"<div class='data-item'><strong>Date:</strong> {extracted_data.date}</div>\n"
+            f"<div class='data-item'><strong>Version Change:</strong> {escape(extracted_data.version_change or 'Not specified')}</div>\n"
+            f"<div class='data-item'><strong>Description:</strong> {escape(extracted_data.description)}</div>\n"
+            "</div>\n"
+        )
+        
+        if source_context:
+            write("<h2>Source Context</h2>\n<div class='section'>\n")
+            for key, value in source_context.items():
+                write(f"<div class='data-item'><strong>{escape(str(key))}:</strong> {escape(str(value))}</div>\n")
+            write("</div>\n")
+        
+        write("<h2>Validation Errors</h2>\n<div class='section'>\n")
+        if validation_result.errors:
+            write("<ul>\n")
+            for error in validation_result.errors:
+                write(f"<li class='error'>{escape(error)}</li>\n")
+            write("</ul>\n</div>\n")
+        else:
+            write("<p>No errors found.</p>\n</div>\n")
+        
+        if validation_result.warnings:
+            write("<h2>Validation Warnings</h2>\n<div class='section'>\n<ul>\n")
+            for warning in validation_result.warnings:
+                write(f"<li class='warning'>{escape(warning)}</li>\n")
+            write("</ul>\n</div>\n")
+        
+        write("<h2>Recommendations</h2>\n<div class='recommendations'>\n<ul>\n")
+        for rec in self._generate_recommendations_list(validation_result):
+            write(f"<li>{escape(rec)}</li>\n")
+        write(f"</ul>\n</div>\n{_HTML_POSTLUDE}")
+    
+    def _generate_recommendations_list(self, validation_result: ValidationResult) -> List[str]:
+        """Generate list of recommendations based on errors."""
+        recommendations = []
+        
+        # Each message is scanned once, case-insensitively, for all keywords;
+        # only the (short) matched keywords are lowercased, not the message
+        for error in validation_result.errors:
+            found = {keyword.lower() for keyword in _ERROR_KEYWORDS.findall(error)}
+            if "repository owner" in found or "repo_owner" in found:
+                recommendations.append("Ensure the repository owner field is provided and not empty")
+            elif "date" in found:
+                recommendations.append("Ensure the date field is provided and valid")
+            elif "description" in found:
+                recommendations.append("Ensure the description field is provided and contains meaningful content")
+            elif "version change" in found or "version_change" in found:
+                recommendations.append("If version change is specified, ensure it follows the format 'X.Y.Z -> A.B.C' or 'X.Y.Z'")
+        
+        for warning in validation_result.warnings:
+            found = {keyword.lower() for keyword in _WARNING_KEYWORDS.findall(warning)}
+            if "short" in found:
+                if "description" in found:
+                    recommendations.append("Provide a more detailed description (at least 20 characters recommended)")
+                elif "owner" in found:
+                    recommendations.append("Verify the repository owner name is correct")
+            elif "format" in found:
+                recommendations.append("Verify the data format matches expected patterns")
+            elif "placeholder" in found:
+                recommendations.append("Replace placeholder text with actual content")
+        
+        if not recommendations:
+            recommendations.append("Review the extracted data and ensure all required fields are properly populated")
+        
+        return recommendations
+    
+    def generate_summary_report(
+        self,
+        failed_validations: List[Dict[str, Any]],
+        summary_stats: Dict[str, Any],
+        format: str = "text"
+    ) -> str:
+        """
+        Generate a summary report of all failed validations.
+        
+        Args:
+            failed_validations: List of failed validation records
+            summary_stats: Summary statistics
+            format: Report format ('text', 'json', 'html')
+            
+        Returns:
+            Path to the generated report file
+        """
+        # Read the clock once; the filename and the report body share it
+        generated_at = datetime.now()
+        filepath = self._report_path("summary_report", generated_at, format)
+        
+        writers = {
+            "text": self._write_summary_text,
+            "json": self._write_summary_json,
+            "html": self._write_summary_html
+        }
+        if format not in writers:
+            raise ValueError(f"Unsupported report format: {format}")
+        
+        self._write_atomically(filepath, writers[format], failed_validations, summary_stats, generated_at)
+        
+        return str(filepath)
+    
+    def _write_summary_text(
+        self,
+        out: TextIO,
+        failed_validations: List[Dict[str, Any]],
+        summary_stats: Dict[str, Any],
+        generated_at: datetime
+    ) -> None:
+        """Write summary report in text format to ``out``."""
+        write = out.write
+        write(f"{_HEAVY_RULE}MONITORING SUMMARY REPORT\n{_HEAVY_RULE}")
+        write(f"Generated: {generated_at:%Y-%m-%d %H:%M:%S}\n")
+        write("\n")
+        
+        write(f"{_LIGHT_RULE}SUMMARY STATISTICS\n{_LIGHT_RULE}")
+        write(f"Total Validations: {summary_stats.get('total_validations', 0)}\n")
+        write(f"Passed: {summary_stats.get('passed', 0)}\n")
+        write(f"Failed: {summary_stats.get('failed', 0)}\n")
+        write(f"Pass Rate: {summary_stats.get('pass_rate', 0):.2f}%\n")
+        write(f"Total Errors: {summary_stats.get('total_errors', 0)}\n")
+        write(f"Total Warnings: {summary_stats.get('total_warnings', 0)}\n")
+        write("\n")
+        
+        if failed_validations:
+            write(f"{_LIGHT_RULE}FAILED VALIDATIONS\n{_LIGHT_RULE}")
+            for i, validation in enumerate(failed_validations, 1):
+                write(f"\n{i}. Timestamp: {validation.get('timestamp', 'N/A')}\n")
+                write(f"   Repository Owner: {validation.get('repo_owner', 'N/A')}\n")
+                write(f"   Date: {validation.get('date', 'N/A')}\n")
+                write(f"   Errors: {', '.join(validation.get('errors', []))}\n")
+                if validation.get('warnings'):
+                    write(f"   Warnings: {', '.join(validation.get('warnings', []))}\n")
+        
+        write("\n")
+        write(f"{_HEAVY_RULE}END OF REPORT\n{_HEAVY_RULE}")
+    
+    def _write_summary_json(
+        self,
+        out: TextIO,
+        failed_validations: List[Dict[str, Any]],
+        summary_stats: Dict[str, Any],
+        generated_at: datetime
+    ) -> None:
+        """Write summary report in JSON format to ``out``."""
+        report_data = {
+            "report_type": "monitoring_summary",
+            "generated_at": generated_at.isoformat(),
+            "summary_statistics": summary_stats,
+            "failed_validations": failed_validations
+        }
+        
+        out.write(dumps(report_data))
+    
+    def _write_summary_html(
+        self,
+        out: TextIO,
+        failed_validations: List[Dict[str, Any]],
+        summary_stats: Dict[str, Any],
+        generated_at: datetime
+    ) -> None:
+        """Write summary report in HTML format to ``out``."""
+        if _SUMMARY_HTML_TEMPLATE is not None:
+            out.writelines(_SUMMARY_HTML_TEMPLATE.generate(
+                generated_at=generated_at,
+                stats=summary_stats,
+                failed_validations=failed_validations
+            ))
+            return
+        
+        write = out.write
+        write(
+            f"{_SUMMARY_HTML_PRELUDE}"
+            "<h1>Monitoring Summary Report</h1>\n"
+            f"<p><strong>Generated:</strong> {generated_at:%Y-%m-%d %H:%M:%S}</p>\n"
+            "<h2>Summary Statistics</h2>\n"
+            "<div class='stats'>\n"
+            f"<div class='stat-item'><div class='stat-label'>Total Validations</div><div class='stat-value'>{summary_stats.get('total_validations', 0)}</div></div>\n"
+            f"<div class='stat-item'><div class='stat-label'>Passed</div><div class='stat-value'>{summary_stats.get('passed', 0)}</div></div>\n"
+            f"<div class='stat-item'><div class='stat-label'>Failed</div><div class='stat-value'>{summary_stats.get('failed', 0)}</div></div>\n"
+            f"<div class='stat-item'><div class='stat-label'>Pass Rate</div><div class='stat-value'>{summary_stats.get('pass_rate', 0):.2f}%</div></div>\n"
+            "</div>\n"
+        )
+        
+        if failed_validations:
+            write("<h2>Failed Validations</h2>\n")
+            for i, validation in enumerate(failed_validations, 1):
+                write(
+                    "<div class='failed-item'>\n"
+                    f"<h3>Failure #{i}</h3>\n"
+                    f"<p><strong>Timestamp:</strong> {validation.get('timestamp', 'N/A')}</p>\n"
+                    f"<p><strong>Repository Owner:</strong> {escape(str(validation.get('repo_owner', 'N/A')))}</p>\n"
+                    f"<p><strong>Date:</strong> {validation.get('date', 'N/A')}</p>\n"
+                    "<p><strong>Errors:</strong></p>\n"
+                    "<ul>\n"
+                )
+                for error in validation.get('errors', []):
+                    write(f"<li class='error'>{escape(error)}</li>\n")
+                write("</ul>\n</div>\n")
+        
+        write(_HTML_POSTLUDE)
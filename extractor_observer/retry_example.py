@@ -1,17 +1,13 @@
 """
 Example of using observer agent with retry functionality.
 """
-import sys
-import os
 from datetime import datetime
 
-# Add extractor directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'extractor'))
-
 from extractor.ai_agent import AIAgent
 from extractor.models import ExtractedInfo
-from models import ExtractedData
-from observer_agent import ObserverAgent
+from extractor_observer.log_utils import log_to_console
+from extractor_observer.models import ExtractedData
+from extractor_observer.observer_agent import ObserverAgent
 
 
 def extract_with_retry_example(commit_message: str, repo_owner: str, date: datetime):
@@ -112,6 +108,9 @@ def extract_with_retry_valid_data():
 
 
 if __name__ == "__main__":
+    # Retry attempts are reported through logging
+    log_to_console()
+    
     # Example 1: Valid data (should pass)
     extract_with_retry_valid_data()
     
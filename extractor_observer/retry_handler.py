@@ -1,9 +1,26 @@
 """
 Retry handler for extractor agent reruns when validation fails.
 """
+import logging
+import re
 from typing import Callable, Optional, Dict, Any, Tuple
-from models import ExtractedData, ValidationResult
-from validators import DataValidator
+from .models import ExtractedData, ValidationResult
+from .validators import DataValidator
+
+logger = logging.getLogger(__name__)
+
+# Keywords that select a retry recommendation, found in one scan per error
+_RECOMMENDATION_KEYWORDS = re.compile(r"repository owner|repo_owner|date|description|version change", re.IGNORECASE)
+
+# Keyword -> (priority, recommendation); when an error mentions several
+# keywords the lowest priority number wins
+_KEYWORD_RECOMMENDATIONS = {
+    "repository owner": (0, "Ensure repository owner is extracted from source context"),
+    "repo_owner": (0, "Ensure repository owner is extracted from source context"),
+    "date": (1, "Ensure date is properly extracted from commit/PR metadata"),
+    "description": (2, "Extract more detailed description from commit message or PR body"),
+    "version change": (3, "Look for version patterns in commit message or PR title/body"),
+}
 
 
 class RetryHandler:
@@ -48,12 +65,7 @@ class RetryHandler:
                 extracted_info = extractor_func(**extractor_args)
                 
                 # Convert to ExtractedData model
-                extracted_data = ExtractedData(
-                    repo_owner=extracted_info.repo_owner,
-                    date=extracted_info.date,
-                    version_change=extracted_info.version_change,
-                    description=extracted_info.description
-                )
+                extracted_data = ExtractedData.from_extracted_info(extracted_info)
                 
                 # Validate
                 validation_result = validation_func(extracted_data)
@@ -69,7 +81,7 @@ class RetryHandler:
                 # If validation fails and we have retries left, prepare for retry
                 if attempt < self.max_retries:
                     retry_count += 1
-                    print(f"Validation failed. Retrying extraction (attempt {retry_count}/{self.max_retries})...")
+                    logger.info("Validation failed. Retrying extraction (attempt %d/%d)...", retry_count, self.max_retries)
                     # Could add delay here if needed
                     continue
                 else:
@@ -80,7 +92,7 @@ class RetryHandler:
                 # If extraction fails, try again if retries available
                 if attempt < self.max_retries:
                     retry_count += 1
-                    print(f"Extraction failed: {e}. Retrying (attempt {retry_count}/{self.max_retries})...")
+                    logger.info("Extraction failed: %s. Retrying (attempt %d/%d)...", e, retry_count, self.max_retries)
                     continue
                 else:
                     # Re-raise exception if no retries left
@@ -115,13 +127,8 @@ class RetryHandler:
         recommendations = []
         
         for error in validation_result.errors:
-            if "repository owner" in error.lower() or "repo_owner" in error.lower():
-                recommendations.append("Ensure repository owner is extracted from source context")
-            elif "date" in error.lower():
-                recommendations.append("Ensure date is properly extracted from commit/PR metadata")
-            elif "description" in error.lower():
-                recommendations.append("Extract more detailed description from commit message or PR body")
-            elif "version change" in error.lower():
-                recommendations.append("Look for version patterns in commit message or PR title/body")
+            found = _RECOMMENDATION_KEYWORDS.findall(error)
+            if found:
+                recommendations.append(min(_KEYWORD_RECOMMENDATIONS[keyword.lower()] for keyword in found)[1])
         
         return recommendations
@@ -0,0 +1,518 @@
+"""
+Test script for the observer agent.
+"""
+import asyncio
+import sys
+import tempfile
+from contextlib import contextmanager
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from extractor_observer.json_utils import dumps
+from extractor_observer.models import ExtractedData
+from extractor_observer import observer_agent
+from extractor_observer.main import _OPTIONS, _build_parser, _fast_parse_args
+from extractor_observer.observer_agent import AI_MAX_TOKENS, AI_RATE_WINDOW, ObserverAgent
+
+
+class _FakeOpenAI:
+    """Stand-in for openai.OpenAI that records requests and finds every item valid."""
+    
+    # False makes every batched reply unusable (no per-item results)
+    batched_replies = True
+    
+    def __init__(self, api_key=None):
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+    
+    def _reply(self, request):
+        self.requests.append(request)
+        verdict = {"is_valid": True, "errors": [], "warnings": []}
+        # Batched requests reserve AI_MAX_TOKENS per item
+        size = request["max_tokens"] // AI_MAX_TOKENS
+        if size > 1:
+            content = dumps({"results": [verdict] * size if self.batched_replies else []})
+        else:
+            content = dumps(verdict)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    
+    def _create(self, **request):
+        return self._reply(request)
+
+
+class _FakeAsyncOpenAI(_FakeOpenAI):
+    """Stand-in for openai.AsyncOpenAI, usable only in the event loop that created it."""
+    
+    instances = []
+    
+    def __init__(self, api_key=None):
+        super().__init__(api_key)
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        self.instances.append(self)
+    
+    async def _create(self, **request):
+        if self.closed or asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("Event loop is closed")
+        return self._reply(request)
+    
+    async def close(self):
+        self.closed = True
+
+
+@contextmanager
+def _fake_openai():
+    """Make ``from openai import AsyncOpenAI`` return _FakeAsyncOpenAI."""
+    saved = sys.modules.get("openai")
+    _FakeAsyncOpenAI.instances = []
+    sys.modules["openai"] = SimpleNamespace(OpenAI=_FakeOpenAI, AsyncOpenAI=_FakeAsyncOpenAI)
+    try:
+        yield
+    finally:
+        if saved is None:
+            del sys.modules["openai"]
+        else:
+            sys.modules["openai"] = saved
+
+
+@contextmanager
+def _config(**changes):
+    """Override CONFIG fields as seen by the observer agent."""
+    saved = observer_agent.CONFIG
+    observer_agent.CONFIG = replace(saved, **changes)
+    try:
+        yield
+    finally:
+        observer_agent.CONFIG = saved
+
+
+def _ai_observer() -> ObserverAgent:
+    """Observer with AI validation switched on, without needing an API key."""
+    observer = ObserverAgent(strict_mode=False, generate_reports=False)
+    observer.use_ai = True
+    observer.model = "test-model"
+    observer.temperature = 0
+    return observer
+
+
+def _commits(count: int, label: str = "change"):
+    """Distinct, valid extractions."""
+    return [
+        ExtractedData(
+            repo_owner="microsoft",
+            date=datetime(2024, 1, 15),
+            version_change=None,
+            description=f"Added {label} number {i} to the authentication flow"
+        )
+        for i in range(count)
+    ]
+
+
+def test_valid_extraction():
+    """Test observation with valid extraction."""
+    print("Test 1: Valid extraction")
+    print("-" * 50)
+    
+    extracted_data = ExtractedData(
+        repo_owner="microsoft",
+        date=datetime.now(),
+        version_change="1.2.3 -> 2.0.0",
+        description="Added new authentication feature with OAuth2 support"
+    )
+    
+    observer = ObserverAgent(strict_mode=False)
+    result = observer.observe_extraction(extracted_data)
+    
+    print(result)
+    print(f"Valid: {result.is_valid}\n")
+
+
+def test_empty_repo_owner():
+    """Test observation with empty repo owner."""
+    print("Test 2: Empty repository owner")
+    print("-" * 50)
+    
+    extracted_data = ExtractedData(
+        repo_owner="",
+        date=datetime.now(),
+        version_change="1.2.3 -> 2.0.0",
+        description="Added new feature"
+    )
+    
+    observer = ObserverAgent(strict_mode=False)
+    result = observer.observe_extraction(extracted_data)
+    
+    print(result)
+    print(f"Valid: {result.is_valid}\n")
+
+
+def test_empty_description():
+    """Test observation with empty description."""
+    print("Test 3: Empty description")
+    print("-" * 50)
+    
+    extracted_data = ExtractedData(
+        repo_owner="github",
+        date=datetime.now(),
+        version_change="2.0.0",
+        description=""
+    )
+    
+    observer = ObserverAgent(strict_mode=False)
+    result = observer.observe_extraction(extracted_data)
+    
+    print(result)
+    print(f"Valid: {result.is_valid}\n")
+
+
+def test_missing_date():
+    """Test observation with missing date."""
+    print("Test 4: Missing date")
+    print("-" * 50)
+    
+    try:
+        extracted_data = ExtractedData(
+            repo_owner="microsoft",
+            date=None,  # This will fail in Pydantic, but testing the concept
+            version_change="1.0.0",
+            description="Fixed bug"
+        )
+        
+        observer = ObserverAgent(strict_mode=False)
+        result = observer.observe_extraction(extracted_data)
+        print(result)
+        print(f"Valid: {result.is_valid}\n")
+    except Exception as e:
+        print(f"Error (expected): {e}\n")
+
+
+def test_invalid_version_change():
+    """Test observation with invalid version change format."""
+    print("Test 5: Invalid version change format")
+    print("-" * 50)
+    
+    extracted_data = ExtractedData(
+        repo_owner="microsoft",
+        date=datetime.now(),
+        version_change="invalid-version-format",
+        description="Version change with invalid format"
+    )
+    
+    observer = ObserverAgent(strict_mode=False)
+    result = observer.observe_extraction(extracted_data)
+    
+    print(result)
+    print(f"Valid: {result.is_valid}\n")
+
+
+def test_batch_observation():
+    """Test batch observation."""
+    print("Test 6: Batch observation")
+    print("-" * 50)
+    
+    extracted_data_list = [
+        ExtractedData(
+            repo_owner="microsoft",
+            date=datetime.now(),
+            version_change="1.0.0 -> 2.0.0",
+            description="First valid extraction"
+        ),
+        ExtractedData(
+            repo_owner="",
+            date=datetime.now(),
+            version_change="2.0.0",
+            description="Second extraction with empty repo owner"
+        ),
+        ExtractedData(
+            repo_owner="github",
+            date=datetime.now(),
+            version_change=None,
+            description="Third valid extraction without version change"
+        )
+    ]
+    
+    observer = ObserverAgent(strict_mode=False)
+    results = observer.observe_batch(extracted_data_list)
+    
+    for i, result in enumerate(results, 1):
+        print(f"Extraction {i}: {'VALID' if result.is_valid else 'INVALID'}")
+        if result.errors:
+            print(f"  Errors: {', '.join(result.errors)}")
+        if result.warnings:
+            print(f"  Warnings: {', '.join(result.warnings)}")
+    
+    print("\nSummary:")
+    summary = observer.get_validation_summary()
+    for key, value in summary.items():
+        print(f"  {key}: {value}")
+    print()
+
+
+def test_shared_results_are_immutable():
+    """A caller cannot change the result later clean items receive."""
+    observer = ObserverAgent(strict_mode=False, generate_reports=False)
+    good = ExtractedData(
+        repo_owner="microsoft",
+        date=datetime(2024, 1, 15),
+        version_change="1.2.3 -> 2.0.0",
+        description="Added new authentication feature with OAuth2 support"
+    )
+    
+    result = observer.observe_extraction(good)
+    try:
+        result.errors.append("x")
+    except AttributeError:
+        pass
+    
+    later = observer.observe_extraction(good)
+    assert later.is_valid
+    assert later.errors == ()
+
+
+def test_rule_cache_reuses_results():
+    """Repeated data is validated once, and cached results cannot be altered."""
+    observer = ObserverAgent(strict_mode=False, generate_reports=False)
+    data = ExtractedData(
+        repo_owner="x",
+        date=datetime(2024, 1, 15),
+        version_change="1.2",
+        description="Bump version"
+    )
+    
+    first = observer.observe_extraction(data)
+    try:
+        first.warnings.append("extra")
+    except AttributeError:
+        pass
+    second = observer.observe_extraction(data)
+    
+    assert second is first
+    assert "extra" not in second.warnings
+    assert len(observer._rule_cache) == 1
+
+
+def test_rule_cache_skips_future_dates():
+    """Results for future dates are not cached, since their warning goes stale."""
+    observer = ObserverAgent(strict_mode=False, generate_reports=False)
+    data = ExtractedData(
+        repo_owner="microsoft",
+        date=datetime(2999, 1, 1),
+        version_change=None,
+        description="Scheduled release of the authentication feature"
+    )
+    
+    result = observer.observe_extraction(data)
+    
+    assert any("future" in warning for warning in result.warnings)
+    assert not observer._rule_cache
+
+
+def test_observe_batch_uses_a_client_per_event_loop():
+    """Each observe_batch call batches its AI requests, even after an earlier call's loop closed."""
+    with _fake_openai():
+        observer = _ai_observer()
+        for run in range(3):
+            results = observer.observe_batch(_commits(3, f"run {run}"))
+            assert all(result.is_valid for result in results)
+    
+    requests = [request for client in _FakeAsyncOpenAI.instances for request in client.requests]
+    assert len(requests) == 3
+    assert all(request["max_tokens"] == 3 * AI_MAX_TOKENS for request in requests)
+    assert all(client.closed for client in _FakeAsyncOpenAI.instances)
+
+
+def test_checkpoint_ignores_another_batch():
+    """A checkpoint left by a different batch is not reused for this one."""
+    invalid = _commits(2, "old")
+    invalid[1] = ExtractedData(repo_owner="", date=datetime(2024, 1, 15), version_change=None,
+                               description="Commit without a repository owner")
+    valid = _commits(2, "new")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "batch.jsonl"
+        observer = ObserverAgent(strict_mode=False, generate_reports=False)
+        assert not observer.observe_batch(invalid, checkpoint_path=path)[1].is_valid
+        
+        results = observer.observe_batch(valid, checkpoint_path=path)
+        assert all(result.is_valid for result in results)
+        
+        # The same batch again resumes from the records just written
+        observer = ObserverAgent(strict_mode=False, generate_reports=False)
+        assert observer.observe_batch(valid, checkpoint_path=path) == results
+        assert observer.get_validation_summary()["total_validations"] == 0
+
+
+def test_checkpoint_strict_resume_raises_again():
+    """The item that stopped a strict batch is validated (and raises) again on resume."""
+    batch = _commits(3)
+    batch[1] = ExtractedData(repo_owner="", date=datetime(2024, 1, 15), version_change=None,
+                             description="Commit without a repository owner")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "batch.jsonl"
+        for _ in range(2):
+            observer = ObserverAgent(strict_mode=True, generate_reports=False)
+            try:
+                observer.observe_batch(batch, checkpoint_path=path)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("strict batch did not raise")
+
+
+def test_parse_ai_batch_response():
+    """Batched replies are only used when they hold one result per item."""
+    verdict = {"is_valid": True, "errors": [], "warnings": []}
+    parse = ObserverAgent._parse_ai_batch_response
+    
+    assert parse(dumps({"results": [verdict, verdict]}), 2) == [verdict, verdict]
+    assert parse(dumps({"results": [verdict]}), 2) is None
+    assert parse(dumps({"results": verdict}), 1) is None
+    assert parse(dumps(verdict), 1) is None
+
+
+def test_ai_batch_fallback_counts_each_item_once():
+    """Items from an unusable batched reply are requested singly and counted as one miss each."""
+    observer = _ai_observer()
+    observer._client = _FakeOpenAI()
+    _FakeOpenAI.batched_replies = False
+    try:
+        results = observer._ai_validate_batch(_commits(3))
+    finally:
+        _FakeOpenAI.batched_replies = True
+    
+    assert all(result["is_valid"] for result in results)
+    # One batched request, then one request per item
+    assert [request["max_tokens"] for request in observer._client.requests] == [3 * AI_MAX_TOKENS] + [AI_MAX_TOKENS] * 3
+    summary = observer.get_validation_summary()
+    assert (summary["ai_cache_hits"], summary["ai_cache_misses"]) == (0, 3)
+    
+    # A single pending item is sent on its own, also counted once
+    observer._ai_validate_batch(_commits(1, "single"))
+    assert observer.get_validation_summary()["ai_cache_misses"] == 4
+    
+    assert observer._ai_validate_batch(_commits(3)) == results
+    summary = observer.get_validation_summary()
+    assert (summary["ai_cache_hits"], summary["ai_cache_misses"]) == (3, 4)
+    assert len(observer._client.requests) == 5
+
+
+def test_ai_batch_fallback_counts_each_item_once_async():
+    """The async batch path falls back the same way."""
+    with _fake_openai():
+        observer = _ai_observer()
+        _FakeOpenAI.batched_replies = False
+        try:
+            results = observer.observe_batch(_commits(3))
+        finally:
+            _FakeOpenAI.batched_replies = True
+    
+    assert all(result.is_valid for result in results)
+    requests = [request for client in _FakeAsyncOpenAI.instances for request in client.requests]
+    assert len(requests) == 4
+    summary = observer.get_validation_summary()
+    assert (summary["ai_cache_hits"], summary["ai_cache_misses"]) == (0, 3)
+
+
+def test_rate_window_throttles_requests():
+    """At most AI_RPM_LIMIT requests are sent per sliding AI_RATE_WINDOW."""
+    observer = ObserverAgent(strict_mode=False, generate_reports=False)
+    with _config(AI_RPM_LIMIT=2):
+        assert observer._rate_window_delay() == 0.0
+        assert observer._rate_window_delay() == 0.0
+        assert 0 < observer._rate_window_delay() <= AI_RATE_WINDOW
+        # A throttled request does not take a slot
+        assert len(observer._ai_request_times) == 2
+        
+        # Once the oldest request leaves the window, its slot is free again
+        observer._ai_request_times[0] -= AI_RATE_WINDOW
+        assert observer._rate_window_delay() == 0.0
+        assert 0 < observer._rate_window_delay() <= AI_RATE_WINDOW
+    
+    with _config(AI_RPM_LIMIT=0):
+        assert all(observer._rate_window_delay() == 0.0 for _ in range(5))
+
+
+def test_history_eviction_keeps_totals_consistent():
+    """With a bounded history, the summary and failed list only cover the retained records."""
+    def unowned(version):
+        return ExtractedData(repo_owner="", date=datetime(2024, 1, 15), version_change=version,
+                             description="Commit without a repository owner")
+    
+    batch = [unowned("1.0.0"), *_commits(1, "first"), unowned("2.0.0"), *_commits(2, "last")]
+    bounded = ObserverAgent(strict_mode=False, generate_reports=False, history_size=3)
+    bounded.observe_batch(batch)
+    # Same totals as an observer that only ever saw the last three items
+    reference = ObserverAgent(strict_mode=False, generate_reports=False)
+    reference.observe_batch(batch[-3:])
+    
+    summary = bounded.get_validation_summary()
+    assert summary == reference.get_validation_summary()
+    assert (summary["total_validations"], summary["passed"], summary["failed"]) == (3, 2, 1)
+    assert [record["version_change"] for record in bounded.get_failed_validations()] == ["2.0.0"]
+    
+    bounded.clear_history()
+    assert bounded.get_validation_summary()["total_validations"] == 0
+    assert bounded.get_failed_validations() == []
+    
+    # An empty history could not keep the totals in step with it
+    try:
+        ObserverAgent(strict_mode=False, generate_reports=False, history_size=0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("history_size=0 was accepted")
+
+
+def test_fast_cli_parser_matches_argparse():
+    """The fast command-line parser agrees with argparse for every option."""
+    required = ["--repo-owner", "microsoft", "--date", "2024-01-15T00:00:00", "--description", "Fix login"]
+    samples = {"--version-change": "1.0.0", "--output": "json", "--report-format": "html", "--max-retries": "5"}
+    parser = _build_parser()
+    
+    def agree(argv):
+        fast = _fast_parse_args(argv)
+        assert fast is not None, argv
+        assert vars(fast) == vars(parser.parse_args(argv)), argv
+    
+    agree(required)
+    for flag, kwargs in _OPTIONS:
+        if kwargs.get("required"):
+            continue
+        agree(required + ([flag] if kwargs.get("action") == "store_true" else [flag, samples[flag]]))
+    
+    # Anything unusual is left to argparse
+    assert _fast_parse_args(required + ["--output", "xml"]) is None
+    assert _fast_parse_args(required + ["--max-retries", "two"]) is None
+    assert _fast_parse_args(required[:-2]) is None
+    assert _fast_parse_args(required + ["--help"]) is None
+
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("OBSERVER AGENT TESTS")
+    print("=" * 50 + "\n")
+    
+    test_valid_extraction()
+    test_empty_repo_owner()
+    test_empty_description()
+    test_missing_date()
+    test_invalid_version_change()
+    test_batch_observation()
+    test_shared_results_are_immutable()
+    test_rule_cache_reuses_results()
+    test_rule_cache_skips_future_dates()
+    test_observe_batch_uses_a_client_per_event_loop()
+    test_checkpoint_ignores_another_batch()
+    test_checkpoint_strict_resume_raises_again()
+    test_parse_ai_batch_response()
+    test_ai_batch_fallback_counts_each_item_once()
+    test_ai_batch_fallback_counts_each_item_once_async()
+    test_rate_window_throttles_requests()
+    test_history_eviction_keeps_totals_consistent()
+    test_fast_cli_parser_matches_argparse()
+    
+    print("=" * 50)
+    print("ALL TESTS COMPLETED")
+    print("=" * 50)
@@ -0,0 +1,380 @@
+"""
+Validators for extracted data from the extractor agent.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta
+import re
+from .models import ExtractedData, ValidationResult
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; batches are then validated row by row
+    pd = None
+
+# Batches at least this large take the column-wise pandas path when available
+VECTORIZE_MIN_BATCH = 64
+# Without pandas, batches at least this large may be split across processes
+# (smaller ones do not repay the pool start-up and pickling), in chunks of
+# PARALLEL_CHUNK_SIZE items per task
+PARALLEL_MIN_BATCH = 4096
+PARALLEL_CHUNK_SIZE = 1024
+
+
+# Placeholder words flagged in short descriptions, in reporting order
+_PLACEHOLDER_INDICATORS = ("todo", "fixme", "placeholder", "example", "test", "n/a", "none")
+_PLACEHOLDER_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(indicator) for indicator in _PLACEHOLDER_INDICATORS) + r")\b",
+    re.IGNORECASE
+)
+
+# Dates further in the past than this are flagged as very old (about 100 years)
+_MAX_AGE = timedelta(days=36500)
+
+# Shared result for data with no findings, returned instead of allocating a
+# fresh result per clean item (ValidationResult is immutable)
+CLEAN_RESULT = ValidationResult(is_valid=True, errors=(), warnings=())
+
+# Any ASCII letter; for ASCII text this matches exactly what str.isalpha accepts
+_ASCII_ALPHA_RE = re.compile(r'[A-Za-z]')
+
+
+# The same few version strings recur across a batch, so results are memoized
+@lru_cache(maxsize=1024)
+def _is_valid_version_format(version: str) -> bool:
+    """Check if version string matches valid format (X.Y.Z or X.Y)."""
+    # Remove 'v' prefix if present
+    parts = version.strip().lstrip('vV').split('.')
+    # isdecimal accepts exactly the characters of the regex class \d, and is
+    # False for the empty parts left by leading, trailing or doubled dots
+    return 2 <= len(parts) <= 3 and all(part.isdecimal() for part in parts)
+
+
+@lru_cache(maxsize=1024)
+def _check_version_change(version_change: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return the (errors, warnings) for a specified version_change value."""
+    version_str = version_change.strip()
+    if not version_str:
+        return ("Version change is specified but empty",), ()
+    
+    # Check for version change patterns: "1.2.3 -> 2.0.0" or single version "1.2.3"
+    warnings = []
+    sep = "->" if "->" in version_str else "→" if "→" in version_str else None
+    if sep:
+        # Version change format: split once on the arrow itself
+        # (splitting on each '-', '>' or '→' character broke "->" in two)
+        old_version, _, new_version = version_str.partition(sep)
+        if "->" in new_version or "→" in new_version:
+            warnings.append(f"Version change format may be invalid: {version_str}")
+        else:
+            old_version = old_version.strip()
+            new_version = new_version.strip()
+            if not _is_valid_version_format(old_version):
+                warnings.append(f"Old version format may be invalid: {old_version}")
+            if not _is_valid_version_format(new_version):
+                warnings.append(f"New version format may be invalid: {new_version}")
+    else:
+        # Single version
+        if not _is_valid_version_format(version_str):
+            warnings.append(f"Version format may be invalid: {version_str}")
+    return (), tuple(warnings)
+
+
+def _has_alpha(text: str) -> bool:
+    """Return True if text contains an alphabetic character."""
+    # The regex scans in C and stops at the first letter; only non-ASCII text
+    # needs the per-character Unicode check
+    if text.isascii():
+        return _ASCII_ALPHA_RE.search(text) is not None
+    return any(c.isalpha() for c in text)
+
+
+# Short descriptions ("Bump version", "Update dependencies") recur across
+# histories and batches, so each is scanned once
+@lru_cache(maxsize=1024)
+def _placeholder_warnings(description: str) -> Tuple[str, ...]:
+    """Warnings for placeholder words in a (short) description, in indicator order."""
+    found = {match.lower() for match in _PLACEHOLDER_RE.findall(description)}
+    return tuple(
+        f"Description may contain placeholder text: '{indicator}'"
+        for indicator in _PLACEHOLDER_INDICATORS
+        if indicator in found
+    )
+
+
+def _validate_fields(extracted_data: ExtractedData, now: datetime, oldest: datetime) -> ValidationResult:
+    """
+    Rule checks behind DataValidator.validate_extracted_data.
+    
+    The reference times are parameters so batch validation computes them
+    once for all items instead of once per item.
+    
+    Args:
+        extracted_data: The extracted data to validate
+        now: Dates after this are flagged as in the future
+        oldest: Dates before this are flagged as very old
+        
+    Returns:
+        ValidationResult with validation status and any errors/warnings
+    """
+    errors = []
+    warnings = []
+    
+    # Read each field once, stripping text fields, and reuse the locals below
+    repo_owner = (extracted_data.repo_owner or "").strip()
+    description = (extracted_data.description or "").strip()
+    desc_len = len(description)
+    date = extracted_data.date
+    version_change = extracted_data.version_change
+    
+    # Check repo_owner - REQUIRED, cannot be empty
+    if not repo_owner:
+        errors.append("Repository owner is empty or missing")
+    elif len(repo_owner) < 2:
+        warnings.append("Repository owner is very short (less than 2 characters)")
+    elif not _has_alpha(repo_owner):
+        warnings.append("Repository owner contains no alphabetic characters")
+    
+    # Check date - REQUIRED, cannot be empty or invalid
+    if not date:
+        errors.append("Date is missing")
+    else:
+        # Validate date is reasonable
+        if date > now:
+            warnings.append(f"Date is in the future: {date}")
+        # Check if date is too old (more than 100 years); a future date
+        # cannot be, so that comparison is skipped
+        elif date < oldest:
+            warnings.append(f"Date is very old: {date}")
+    
+    # Check description - REQUIRED, cannot be empty
+    if not description:
+        errors.append("Description is empty or missing")
+    elif desc_len < 10:
+        warnings.append("Description is very short (less than 10 characters)")
+    elif desc_len > 10000:
+        warnings.append("Description is very long (more than 10000 characters)")
+    
+    # Check version_change - OPTIONAL, but if present should be valid format
+    if version_change is not None:
+        version_errors, version_warnings = _check_version_change(version_change)
+        errors.extend(version_errors)
+        warnings.extend(version_warnings)
+    
+    # Additional quality checks
+    if description and desc_len < 50:
+        # Check for placeholder text (whole words only, so e.g. "testing" is not flagged)
+        warnings.extend(_placeholder_warnings(description))
+    
+    if not errors and not warnings:
+        return CLEAN_RESULT
+    
+    is_valid = len(errors) == 0
+    
+    return ValidationResult(
+        is_valid=is_valid,
+        errors=tuple(errors),
+        warnings=tuple(warnings)
+    )
+
+
+def _validate_chunk(extracted_data_list: List[ExtractedData], now: datetime) -> List[ValidationResult]:
+    """Row-by-row validation of a list sharing one reference time (also run in worker processes)."""
+    oldest = now - _MAX_AGE
+    return [_validate_fields(d, now, oldest) for d in extracted_data_list]
+
+
+def _validate_batch_parallel(
+    extracted_data_list: List[ExtractedData],
+    now: datetime,
+    max_workers: int
+) -> List[ValidationResult]:
+    """Split a batch into chunks validated in worker processes, keeping input order."""
+    chunks = [
+        extracted_data_list[start:start + PARALLEL_CHUNK_SIZE]
+        for start in range(0, len(extracted_data_list), PARALLEL_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        return [
+            result
+            for chunk_results in executor.map(_validate_chunk, chunks, repeat(now))
+            for result in chunk_results
+        ]
+
+
+def _validate_batch_vectorized(extracted_data_list: List[ExtractedData], now: datetime) -> List[ValidationResult]:
+    """Column-wise implementation of DataValidator.validate_batch (requires pandas)."""
+    frame = pd.DataFrame(
+        [(d.repo_owner, d.date, d.description) for d in extracted_data_list],
+        columns=["repo_owner", "date", "description"],
+        dtype=object
+    )
+    
+    owner = frame["repo_owner"].fillna("").str.strip()
+    owner_len = owner.str.len()
+    owner_empty = owner_len.eq(0)
+    owner_short = ~owner_empty & owner_len.lt(2)
+    # Owners repeat heavily within a batch, so test each distinct value once
+    owner_has_alpha = owner.map({value: _has_alpha(value) for value in owner.unique()})
+    owner_no_alpha = ~owner_empty & ~owner_short & ~owner_has_alpha.astype(bool)
+    
+    dates = frame["date"]
+    date_missing = dates.isna()
+    present = dates[~date_missing]
+    date_future = (present > now).reindex(frame.index, fill_value=False)
+    date_old = (present < now - _MAX_AGE).reindex(frame.index, fill_value=False)
+    
+    description = frame["description"].fillna("").str.strip()
+    desc_len = description.str.len()
+    desc_empty = desc_len.eq(0)
+    desc_short = ~desc_empty & desc_len.lt(10)
+    desc_long = desc_len.gt(10000)
+    needs_placeholder_scan = ~desc_empty & desc_len.lt(50)
+    placeholders = (
+        description[needs_placeholder_scan].map(_placeholder_warnings)
+        .reindex(frame.index)
+    )
+    
+    results = []
+    for extracted_data, o_empty, o_short, o_no_alpha, d_missing, d_future, d_old, \
+            ds_empty, ds_short, ds_long, placeholder_warnings in zip(
+                extracted_data_list,
+                owner_empty.tolist(), owner_short.tolist(), owner_no_alpha.tolist(),
+                date_missing.tolist(), date_future.tolist(), date_old.tolist(),
+                desc_empty.tolist(), desc_short.tolist(), desc_long.tolist(),
+                placeholders.tolist()
+            ):
+        # Messages are assembled in the same order as validate_extracted_data
+        errors = []
+        warnings = []
+        if o_empty:
+            errors.append("Repository owner is empty or missing")
+        elif o_short:
+            warnings.append("Repository owner is very short (less than 2 characters)")
+        elif o_no_alpha:
+            warnings.append("Repository owner contains no alphabetic characters")
+        
+        if d_missing:
+            errors.append("Date is missing")
+        else:
+            if d_future:
+                warnings.append(f"Date is in the future: {extracted_data.date}")
+            if d_old:
+                warnings.append(f"Date is very old: {extracted_data.date}")
+        
+        if ds_empty:
+            errors.append("Description is empty or missing")
+        elif ds_short:
+            warnings.append("Description is very short (less than 10 characters)")
+        elif ds_long:
+            warnings.append("Description is very long (more than 10000 characters)")
+        
+        if extracted_data.version_change is not None:
+            version_errors, version_warnings = _check_version_change(extracted_data.version_change)
+            errors.extend(version_errors)
+            warnings.extend(version_warnings)
+        
+        if isinstance(placeholder_warnings, tuple):
+            warnings.extend(placeholder_warnings)
+        
+        results.append(
+            ValidationResult(is_valid=not errors, errors=tuple(errors), warnings=tuple(warnings))
+            if errors or warnings else CLEAN_RESULT
+        )
+    
+    return results
+
+
+class DataValidator:
+    """Validator for extracted data from the extractor agent."""
+    
+    @staticmethod
+    def validate_extracted_data(
+        extracted_data: ExtractedData,
+        now: Optional[datetime] = None
+    ) -> ValidationResult:
+        """
+        Validate that extracted data is complete and valid.
+        
+        Main check: No data extracted can be empty or invalid.
+        
+        Args:
+            extracted_data: The extracted data to validate
+            now: Reference time for the date checks; batch callers pass one
+                 value for every item. Defaults to datetime.now().
+            
+        Returns:
+            ValidationResult with validation status and any errors/warnings
+        """
+        if now is None:
+            now = datetime.now()
+        return _validate_fields(extracted_data, now, now - _MAX_AGE)
+    
+    @staticmethod
+    def validate_batch(
+        extracted_data_list: List[ExtractedData],
+        now: Optional[datetime] = None,
+        max_workers: int = 1
+    ) -> List[ValidationResult]:
+        """
+        Validate many extractions at once.
+        
+        Batches of VECTORIZE_MIN_BATCH items or more are checked column-wise
+        with pandas string operations when pandas is installed. Without
+        pandas, batches of PARALLEL_MIN_BATCH items or more can be split
+        across worker processes. Either way the results are the same as
+        calling validate_extracted_data on each item.
+        
+        Args:
+            extracted_data_list: The extracted data to validate
+            now: Reference time for the date checks. Defaults to datetime.now().
+            max_workers: Worker processes for large batches without pandas;
+                         1 validates in this process
+            
+        Returns:
+            One ValidationResult per item, in input order
+        """
+        if now is None:
+            now = datetime.now()
+        if pd is not None and len(extracted_data_list) >= VECTORIZE_MIN_BATCH:
+            return _validate_batch_vectorized(extracted_data_list, now)
+        if max_workers > 1 and len(extracted_data_list) >= PARALLEL_MIN_BATCH:
+            return _validate_batch_parallel(extracted_data_list, now, max_workers)
+        return _validate_chunk(extracted_data_list, now)
+    
+    @staticmethod
+    def validate_completeness(extracted_data: ExtractedData) -> ValidationResult:
+        """
+        Validate that all required fields are present and non-empty.
+        
+        Args:
+            extracted_data: The extracted data to validate
+            
+        Returns:
+            ValidationResult with validation status
+        """
+        errors = []
+        
+        # Required fields that cannot be empty
+        required_fields = (
+            ("repo_owner", extracted_data.repo_owner),
+            ("date", extracted_data.date),
+            ("description", extracted_data.description)
+        )
+        
+        for field_name, field_value in required_fields:
+            if field_value is None:
+                errors.append(f"{field_name} is None")
+            # Blank test without building a stripped copy of the field
+            elif isinstance(field_value, str) and (not field_value or field_value.isspace()):
+                errors.append(f"{field_name} is empty")
+        
+        if not errors:
+            return CLEAN_RESULT
+        
+        return ValidationResult(
+            is_valid=False,
+            errors=tuple(errors)
+        )
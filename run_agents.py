@@ -2,37 +2,28 @@
 Script to run extractor and observer agents on a repository.
 """
 import sys
-import os
-import argparse
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
-# Add extractor and observer directories to path
-base_dir = os.path.dirname(__file__)
-extractor_path = os.path.join(base_dir, 'extractor')
-observer_path = os.path.join(base_dir, 'extractor observer')
-sys.path.insert(0, extractor_path)
-sys.path.insert(0, observer_path)
+# The extractor and observer modules (pydantic, openai, GitPython/PyGithub)
+# are imported by the run that needs them, not for --help or usage errors
 
-from extractor.ai_agent import AIAgent
-from extractor.git_integration import GitIntegration
-from extractor.github_integration import GitHubIntegration
-from extractor.models import ExtractedInfo
 
-# Import observer modules (handle space in directory name)
-import importlib.util
-
-observer_models_path = os.path.join(observer_path, 'models.py')
-spec_models = importlib.util.spec_from_file_location("observer_models", observer_models_path)
-observer_models = importlib.util.module_from_spec(spec_models)
-spec_models.loader.exec_module(observer_models)
-ExtractedData = observer_models.ExtractedData
-
-observer_agent_path = os.path.join(observer_path, 'observer_agent.py')
-spec_agent = importlib.util.spec_from_file_location("observer_agent", observer_agent_path)
-observer_agent = importlib.util.module_from_spec(spec_agent)
-spec_agent.loader.exec_module(observer_agent)
-ObserverAgent = observer_agent.ObserverAgent
+def _retry_extractor(first_result, extract):
+    """
+    Build the extractor_func for observe_with_retry.
+    
+    The first attempt reuses the extraction already made in step 1; each
+    retry calls extract again, which re-runs only the AI step on the
+    commit or PR fetched up front.
+    """
+    pending = [first_result]
+    
+    def extractor():
+        return pending.pop() if pending else extract()
+    
+    return extractor
 
 
 def run_on_local_repo(repo_path: str, commit_sha: str = None, max_retries: int = 2):
@@ -53,12 +44,14 @@ def run_on_local_repo(repo_path: str, commit_sha: str = None, max_retries: int =
     try:
         # Step 1: Extract using extractor agent
         print("Step 1: Extracting information from repository...")
+        from extractor.git_integration import GitIntegration
+        from extractor_observer.models import ExtractedData
+        from extractor_observer.observer_agent import ObserverAgent
         git = GitIntegration(repo_path=repo_path)
         
-        if commit_sha:
-            extracted_info = git.extract_from_commit_sha(commit_sha, use_ai=True)
-        else:
-            extracted_info = git.extract_from_head(use_ai=True)
+        # Read the commit once; retries only repeat the AI extraction
+        extract = partial(git.agent.extract_from_commit, *git.read_commit(commit_sha or "HEAD"))
+        extracted_info = extract()
         
         print("✓ Extraction completed")
         print(f"  - Repository Owner: {extracted_info.repo_owner}")
@@ -68,12 +61,7 @@ def run_on_local_repo(repo_path: str, commit_sha: str = None, max_retries: int =
         
         # Step 2: Convert to observer data model
         print("\nStep 2: Converting to observer data model...")
-        extracted_data = ExtractedData(
-            repo_owner=extracted_info.repo_owner,
-            date=extracted_info.date,
-            version_change=extracted_info.version_change,
-            description=extracted_info.description
-        )
+        extracted_data = ExtractedData.from_extracted_info(extracted_info)
         
         # Step 3: Observe with retry
         print("\nStep 3: Observing and validating with automatic retry...")
@@ -84,8 +72,8 @@ def run_on_local_repo(repo_path: str, commit_sha: str = None, max_retries: int =
         )
         
         extracted_data, validation_result, retry_count = observer.observe_with_retry(
-            extractor_func=git.extract_from_commit_sha if commit_sha else git.extract_from_head,
-            extractor_args={"commit_sha": commit_sha or "HEAD", "use_ai": True},
+            extractor_func=_retry_extractor(extracted_info, extract),
+            extractor_args={},
             source_context={
                 "type": "local_repository",
                 "repo_path": repo_path,
@@ -111,7 +99,7 @@ def run_on_local_repo(repo_path: str, commit_sha: str = None, max_retries: int =
             
             if retry_count >= max_retries:
                 print(f"\n⚠️  All retry attempts exhausted.")
-                print(f"📄 Report generated in: extractor observer/reports/")
+                print(f"📄 Report generated in: {observer.report_generator.reports_dir}/")
         
         print("=" * 70 + "\n")
         
@@ -152,16 +140,21 @@ def run_on_github_repo(repo_name: str, pr_number: int = None, commit_sha: str =
     try:
         # Step 1: Extract using GitHub integration
         print("Step 1: Extracting information from GitHub...")
+        from extractor.github_integration import GitHubIntegration
+        from extractor_observer.models import ExtractedData
+        from extractor_observer.observer_agent import ObserverAgent
         github = GitHubIntegration()
         
+        # Fetch the PR or commit once; retries only repeat the AI extraction
         if pr_number:
-            extracted_info = github.extract_from_pr_number(repo_name, pr_number, use_ai=True)
+            extract = partial(github.agent.extract_from_pr, *github.read_pr(repo_name, pr_number))
             source_type = "pull_request"
             source_id = f"PR #{pr_number}"
         else:
-            extracted_info = github.extract_from_commit_sha(repo_name, commit_sha, use_ai=True)
+            extract = partial(github.agent.extract_from_commit, *github.read_commit(repo_name, commit_sha))
             source_type = "commit"
             source_id = commit_sha
+        extracted_info = extract()
         
         print("✓ Extraction completed")
         print(f"  - Repository Owner: {extracted_info.repo_owner}")
@@ -171,12 +164,7 @@ def run_on_github_repo(repo_name: str, pr_number: int = None, commit_sha: str =
         
         # Step 2: Convert and observe
         print("\nStep 2: Observing and validating with automatic retry...")
-        extracted_data = ExtractedData(
-            repo_owner=extracted_info.repo_owner,
-            date=extracted_info.date,
-            version_change=extracted_info.version_change,
-            description=extracted_info.description
-        )
+        extracted_data = ExtractedData.from_extracted_info(extracted_info)
         
         observer = ObserverAgent(
             strict_mode=False,
@@ -184,15 +172,8 @@ def run_on_github_repo(repo_name: str, pr_number: int = None, commit_sha: str =
             max_retries=max_retries
         )
         
-        # For GitHub, we need to re-extract on retry
-        def extract_func(**kwargs):
-            if pr_number:
-                return github.extract_from_pr_number(repo_name, pr_number, use_ai=True)
-            else:
-                return github.extract_from_commit_sha(repo_name, commit_sha, use_ai=True)
-        
         extracted_data, validation_result, retry_count = observer.observe_with_retry(
-            extractor_func=extract_func,
+            extractor_func=_retry_extractor(extracted_info, extract),
             extractor_args={},
             source_context={
                 "type": source_type,
@@ -216,7 +197,7 @@ def run_on_github_repo(repo_name: str, pr_number: int = None, commit_sha: str =
             
             if retry_count >= max_retries:
                 print(f"\n⚠️  All retry attempts exhausted.")
-                print(f"📄 Report generated in: extractor observer/reports/")
+                print(f"📄 Report generated in: {observer.report_generator.reports_dir}/")
         
         print("=" * 70 + "\n")
         
@@ -231,6 +212,9 @@ def run_on_github_repo(repo_name: str, pr_number: int = None, commit_sha: str =
 
 def main():
     """Main function."""
+    # Imported here so scripts importing this module do not pay for argparse
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Run extractor and observer agents on a repository"
     )
@@ -268,6 +252,10 @@ def main():
     
     args = parser.parse_args()
     
+    # The observer reports progress (e.g. generated report paths) through logging
+    from extractor_observer.log_utils import log_to_console
+    log_to_console()
+    
     # Validate arguments
     if args.repo_path and args.github_repo:
         print("❌ Error: Cannot specify both --repo-path and --github-repo")